@@ -18,12 +18,22 @@ Designed to be run daily via cron or OpenClaw scheduled task.
 
 import os
 import sys
+import asyncio
+import json
+import ctypes
+import shelve
 import time
+import socket
+import atexit
 import logging
+import logging.handlers
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 from datetime import datetime
+from contextlib import contextmanager
 
 # Add scripts dir to path for imports
 SCRIPT_DIR = Path(__file__).parent
@@ -33,11 +43,24 @@ sys.path.insert(0, str(SCRIPT_DIR))
 LOG_DIR = SCRIPT_DIR.parent / "logs"
 LOG_DIR.mkdir(exist_ok=True)
 
+# Buffer file writes: progress chatter goes to disk in batches, WARNING and
+# above (and exit) flush immediately
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+_file_handler = logging.FileHandler(LOG_DIR / 'daily_vault_sync.log')
+_file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+_file_buffer = logging.handlers.MemoryHandler(
+    capacity=100,
+    flushLevel=logging.WARNING,
+    target=_file_handler,
+    flushOnClose=True
+)
+atexit.register(_file_buffer.flush)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+    format=LOG_FORMAT,
     handlers=[
-        logging.FileHandler(LOG_DIR / 'daily_vault_sync.log'),
+        _file_buffer,
         logging.StreamHandler()
     ]
 )
@@ -57,20 +80,264 @@ RECALL_API_TOKEN = os.environ.get("RECALL_API_TOKEN", "")
 SHUTDOWN_SERVER_URL = f"http://{GPU_PC_IP}:8765"
 SHUTDOWN_TOKEN = os.environ.get("SHUTDOWN_TOKEN", "")
 
+# Request URLs and headers, built once (the polling loops reuse them)
+OLLAMA_TAGS_URL = f"http://{GPU_PC_IP}:{OLLAMA_PORT}/api/tags"
+START_URL = f"{RECALL_API_URL}/index/start"
+PROGRESS_URL = f"{RECALL_API_URL}/index/progress"
+PROGRESS_STREAM_URL = f"{RECALL_API_URL}/index/progress/stream"
+SHUTDOWN_URL = f"{SHUTDOWN_SERVER_URL}/shutdown"
+AUTH_HEADERS = {"Authorization": f"Bearer {RECALL_API_TOKEN}"}
+JSON_HEADERS = {**AUTH_HEADERS, "Content-Type": "application/json"}
+SSE_HEADERS = {**AUTH_HEADERS, "Accept": "text/event-stream"}
+SHUTDOWN_HEADERS = {"Authorization": f"Bearer {SHUTDOWN_TOKEN}"}
+
 # Timeouts
 GPU_WAKE_TIMEOUT = 180  # 3 minutes to wake
 GPU_INDEX_TIMEOUT = 1800  # 30 minutes max for indexing
 POLL_INTERVAL = 30  # Check progress every 30s
+LONG_POLL_WAIT = 25  # Server holds /index/progress open until progress changes
 
 # Vault paths (for pre-check) - must be set via environment variable
 OBSIDIAN_WORK_PATH = Path(os.environ.get("OBSIDIAN_WORK_PATH", "./obsidian/work"))
 LAST_INDEX_FILE = SCRIPT_DIR.parent / "logs" / ".last_index_time"
 
+# Per-directory stat cache (shelve): {dir_path: [dir_mtime, {md_name: mtime}, [subdirs]]}
+STAT_CACHE_FILE = SCRIPT_DIR.parent / "logs" / ".stat_cache.db"
+# Trust the cache for directories whose mtime hasn't changed. A directory's
+# mtime only moves when entries are added/removed/renamed, so in-place edits
+# inside a trusted directory are NOT detected - opt-in for append-only vaults.
+PRUNE_UNCHANGED_DIRS = os.environ.get("PRUNE_UNCHANGED_DIRS", "false").lower() == "true"
+# Changed-path list maintained by vault_watcher.py (inotify sidecar). When it
+# exists the walk is skipped; FALLBACK_POLL=true always walks (NFS/CIFS vaults)
+PENDING_INDEX_FILE = SCRIPT_DIR.parent / "logs" / ".pending_index"
+PENDING_INFLIGHT_FILE = SCRIPT_DIR.parent / "logs" / ".pending_index.inflight"
+# Private name .pending_index is renamed to before merging into the inflight list
+PENDING_CLAIM_FILE = SCRIPT_DIR.parent / "logs" / ".pending_index.claim"
+FALLBACK_POLL = os.environ.get("FALLBACK_POLL", "false").lower() == "true"
+# Seconds for the watcher to record the reorganize step's writes before the claim
+WATCHER_SETTLE_SECONDS = 2
+# Threads used to stat notes. 1 = serial (best on local disks); raise it
+# (16-64) for NFS/SMB vaults where each stat() is a network round-trip
+SCAN_WORKERS = int(os.environ.get("SCAN_WORKERS", "1"))
+
+# Shared HTTP session used for every call below: keeps connections alive
+# between calls and retries failed connects and gateway errors (POSTs are not
+# replayed once the request was sent). Auth stays per-request because the
+# WOL, Recall and shutdown servers each use their own token.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+
+# Scan result waiting to be persisted once the index run succeeds
+_pending_stat_cache = None
+
+
+@contextmanager
+def _stat_cache():
+    """Open the stat cache read-only; an empty dict if there is none yet."""
+    try:
+        db = shelve.open(str(STAT_CACHE_FILE), flag="r")
+    except Exception:
+        yield {}
+        return
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _save_stat_cache(pending):
+    """Write back only the directories that were (re)listed; drop vanished ones."""
+    changed, visited = pending
+    with shelve.open(str(STAT_CACHE_FILE), flag="c") as db:
+        for key in [k for k in db.keys() if k not in visited]:
+            del db[key]
+        db.update(changed)
+
+
+def _load_statx():
+    """glibc's statx() wrapper (Linux 4.11+, glibc 2.28+), or None if unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        statx = libc.statx
+    except (OSError, AttributeError):
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_void_p]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+_STATX = _load_statx()
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_MTIME = 0x40
+
+
+def _safe_mtime(path: str):
+    """
+    mtime of path, or None if it is gone.
+    On Linux this asks statx() for STATX_MTIME only, with AT_STATX_DONT_SYNC so
+    network/FUSE mounts can answer from cached attributes instead of
+    revalidating with the server.
+    """
+    if _STATX is not None:
+        buf = ctypes.create_string_buffer(256)  # struct statx
+        if _STATX(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, _STATX_MTIME, buf) == 0:
+            raw = buf.raw
+            stx_mask = int.from_bytes(raw[0:4], sys.byteorder)
+            if stx_mask & _STATX_MTIME:
+                # stx_mtime: struct statx_timestamp at offset 112 (s64 sec, u32 nsec)
+                sec = int.from_bytes(raw[112:120], sys.byteorder, signed=True)
+                nsec = int.from_bytes(raw[120:124], sys.byteorder)
+                return sec + nsec * 1e-9
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def _stat_mtimes(paths: list) -> list:
+    """mtime (or None if gone) for each path, using SCAN_WORKERS threads."""
+    if SCAN_WORKERS <= 1 or len(paths) < 2:
+        return [_safe_mtime(p) for p in paths]
+    
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as ex:
+        return list(ex.map(_safe_mtime, paths, chunksize=64))
+
+
+def _scan_vault(root, last_index_time: float, stat_cache):
+    """
+    Walk root with os.scandir.
+    Returns (new_files, total_files, (changed_entries, visited_dirs)), where
+    changed_entries holds only directories whose listing differs from the cache.
+
+    Directory type comes from readdir, so only the .md files get stat'ed; the
+    stats run after the walk so they can be spread over SCAN_WORKERS threads.
+    With PRUNE_UNCHANGED_DIRS, a directory whose mtime matches the cache is
+    trusted: if it also predates the last index it is not listed at all (its
+    cached count is reused), otherwise it is listed but only names missing
+    from the cache are stat'ed.
+    """
+    new_files = []
+    listed = []  # (dir path, [dir_mtime, files, subdirs], cached entry)
+    visited = set()
+    reused_files = 0
+    to_stat = []  # (files dict of the parent dir, name, path)
+    stack = [str(root)]
+    
+    while stack:
+        current = stack.pop()
+        try:
+            dir_mtime = os.stat(current).st_mtime
+        except OSError:
+            continue
+        visited.add(current)
+        
+        cached = stat_cache.get(current)
+        trusted = PRUNE_UNCHANGED_DIRS and cached and cached[0] == dir_mtime
+        if trusted and dir_mtime <= last_index_time:
+            reused_files += len(cached[1])
+            stack.extend(cached[2])
+            continue
+        
+        known = cached[1] if trusted else {}
+        files = {}
+        subdirs = []
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        elif entry.name.endswith(".md"):
+                            mtime = known.get(entry.name)
+                            if mtime is None:
+                                to_stat.append((files, entry.name, entry.path))
+                                continue
+                            files[entry.name] = mtime
+                            if mtime > last_index_time:
+                                new_files.append(entry.path)
+                    except OSError:
+                        pass
+        except OSError:
+            visited.discard(current)
+            continue
+        
+        listed.append((current, [dir_mtime, files, subdirs], cached))
+        stack.extend(subdirs)
+    
+    mtimes = _stat_mtimes([path for _, _, path in to_stat])
+    for (files, name, path), mtime in zip(to_stat, mtimes):
+        if mtime is None:
+            continue
+        files[name] = mtime
+        if mtime > last_index_time:
+            new_files.append(path)
+    
+    total_files = reused_files + sum(len(entry[1]) for _, entry, _ in listed)
+    # Unchanged directories are already in the cache as-is; don't rewrite them
+    changed = {path: entry for path, entry, cached in listed if entry != cached}
+    return new_files, total_files, (changed, visited)
+
+
+def _claim_pending_paths():
+    """
+    Claim the watcher's change list by renaming it to PENDING_INFLIGHT_FILE,
+    merged with any list left over from a run that failed to index.
+    Returns the deduped paths, or None if a full scan is needed (no watcher
+    running, or the watcher flagged lost events with a "*" line).
+    """
+    def merge_claim():
+        with open(PENDING_INFLIGHT_FILE, "a") as inflight:
+            inflight.write(PENDING_CLAIM_FILE.read_text())
+        PENDING_CLAIM_FILE.unlink()
+    
+    try:
+        if PENDING_CLAIM_FILE.exists():
+            # Left behind by a run interrupted mid-merge
+            merge_claim()
+        if PENDING_INDEX_FILE.exists():
+            if PENDING_INFLIGHT_FILE.exists():
+                # Rename first, so the watcher can't append between the read
+                # and the delete (it re-records lines that miss the live file)
+                os.rename(PENDING_INDEX_FILE, PENDING_CLAIM_FILE)
+                merge_claim()
+            else:
+                os.rename(PENDING_INDEX_FILE, PENDING_INFLIGHT_FILE)
+        elif not PENDING_INFLIGHT_FILE.exists():
+            return None
+    except OSError as e:
+        logger.warning(f"Could not claim {PENDING_INDEX_FILE}: {e}")
+        return None
+    
+    try:
+        lines = PENDING_INFLIGHT_FILE.read_text().splitlines()
+    except OSError:
+        return None
+    
+    paths = list(dict.fromkeys(line for line in lines if line))
+    if "*" in paths:
+        return None
+    if not paths:
+        # Nothing to carry over to the next run
+        PENDING_INFLIGHT_FILE.unlink(missing_ok=True)
+    return paths
+
 
 def check_for_new_files():
     """
     Check if there are new/modified files since last index.
-    Returns (has_new_files, new_count, total_count).
+    Returns (has_new_files, new_count, total_count); total_count is None when
+    the watcher's change list was used.
     """
     logger.info("🔍 Checking for new/modified files...")
     
@@ -83,28 +350,34 @@ def check_for_new_files():
         except:
             pass
     
-    # Scan vault for .md files
-    new_files = []
-    total_files = 0
-    
-    for md_file in OBSIDIAN_WORK_PATH.rglob("*.md"):
-        total_files += 1
-        try:
-            mtime = md_file.stat().st_mtime
-            if mtime > last_index_time:
-                new_files.append(md_file)
-        except:
-            pass
+    # Use the watcher's change list when available, else scan vault for .md files
+    global _pending_stat_cache
+    pending = None if FALLBACK_POLL else _claim_pending_paths()
+    if pending is not None:
+        logger.info("Using change list from vault watcher (no scan)")
+        new_files = pending
+        # The stat cache is only refreshed by scans, so there is no reliable total
+        total_files = None
+    else:
+        with _stat_cache() as cache:
+            new_files, total_files, _pending_stat_cache = _scan_vault(
+                OBSIDIAN_WORK_PATH, last_index_time, cache
+            )
     
     new_count = len(new_files)
     
     if new_count > 0:
-        logger.info(f"📄 Found {new_count} new/modified files (out of {total_files} total)")
+        if total_files is None:
+            logger.info(f"📄 Found {new_count} new/modified files")
+        else:
+            logger.info(f"📄 Found {new_count} new/modified files (out of {total_files} total)")
         # Log first few new files
         for f in new_files[:5]:
-            logger.info(f"  - {f.name}")
+            logger.info(f"  - {os.path.basename(f)}")
         if new_count > 5:
             logger.info(f"  ... and {new_count - 5} more")
+    elif total_files is None:
+        logger.info("✅ No new files since last index")
     else:
         logger.info(f"✅ No new files since last index ({total_files} files unchanged)")
     
@@ -115,6 +388,10 @@ def save_index_timestamp():
     """Save current timestamp as last index time."""
     try:
         LAST_INDEX_FILE.write_text(str(time.time()))
+        if _pending_stat_cache is not None:
+            _save_stat_cache(_pending_stat_cache)
+        # The claimed change list has been indexed
+        PENDING_INFLIGHT_FILE.unlink(missing_ok=True)
         logger.info("📝 Saved index timestamp")
     except Exception as e:
         logger.warning(f"Could not save index timestamp: {e}")
@@ -125,23 +402,37 @@ def run_reorganize():
     logger.info("🔄 Running vault reorganization...")
     
     import subprocess
-    result = subprocess.run(
+    import threading
+    from collections import deque
+    
+    # Stream output instead of buffering it: only the summary line matters,
+    # and stderr is drained on a thread (keeping just its tail) so neither
+    # pipe can fill up and stall the child
+    proc = subprocess.Popen(
         [sys.executable, str(SCRIPT_DIR / "reorganize_v2.py"), "--apply"],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         cwd=str(SCRIPT_DIR.parent)
     )
+    stderr_tail = deque(maxlen=50)
+    drain = threading.Thread(target=stderr_tail.extend, args=(proc.stderr,), daemon=True)
+    drain.start()
+    
+    # Raw bytes: only the summary line is ever decoded
+    summary = None
+    for line in proc.stdout:
+        if summary is None and b'Total actions:' in line:
+            summary = line.decode(errors="replace").strip()
     
-    if result.returncode != 0:
-        logger.error(f"Reorganization failed: {result.stderr}")
+    returncode = proc.wait()
+    drain.join()
+    
+    if returncode != 0:
+        logger.error(f"Reorganization failed: {b''.join(stderr_tail).decode(errors='replace')}")
         return False
     
-    # Count actions from output
-    lines = result.stdout.split('\n')
-    for line in lines:
-        if 'Total actions:' in line:
-            logger.info(f"✅ Reorganization complete - {line.strip()}")
-            break
+    if summary:
+        logger.info(f"✅ Reorganization complete - {summary}")
     
     return True
 
@@ -151,7 +442,7 @@ def wake_gpu_pc():
     logger.info(f"⚡ Sending Wake-on-LAN to GPU PC ({GPU_PC_MAC})...")
     
     try:
-        resp = requests.post(
+        resp = SESSION.post(
             f"{WOL_SERVER_URL}/wake",
             json={"mac": GPU_PC_MAC},
             timeout=10
@@ -167,23 +458,42 @@ def wake_gpu_pc():
         return False
 
 
+def _port_open(host: str, port: int, timeout: float = 1) -> bool:
+    """Cheap TCP probe: True once something is listening on host:port."""
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    s.settimeout(timeout)
+    try:
+        return s.connect_ex((host, port)) == 0
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+
 def wait_for_gpu_ollama():
     """Wait for GPU PC's Ollama to become available."""
     logger.info(f"⏳ Waiting for GPU Ollama at {GPU_PC_IP}:{OLLAMA_PORT}...")
     
-    start = time.time()
-    ollama_url = f"http://{GPU_PC_IP}:{OLLAMA_PORT}/api/tags"
-    
-    while time.time() - start < GPU_WAKE_TIMEOUT:
-        try:
-            resp = requests.get(ollama_url, timeout=5)
-            if resp.status_code == 200:
-                logger.info("✅ GPU Ollama is ready!")
-                return True
-        except requests.exceptions.RequestException:
-            pass
+    deadline = time.time() + GPU_WAKE_TIMEOUT
+    delay = 0.25
+    
+    while True:
+        # Only pay for an HTTP round-trip once the port accepts connections
+        if _port_open(GPU_PC_IP, OLLAMA_PORT):
+            try:
+                resp = SESSION.get(OLLAMA_TAGS_URL, timeout=5)
+                if resp.status_code == 200:
+                    logger.info("✅ GPU Ollama is ready!")
+                    return True
+            except requests.exceptions.RequestException:
+                pass
         
-        time.sleep(5)
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            break
+        # Never sleep past the deadline; the last probe lands right on it
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 5)
     
     logger.error(f"❌ GPU Ollama not available after {GPU_WAKE_TIMEOUT}s")
     return False
@@ -193,18 +503,13 @@ def trigger_gpu_reindex():
     """Trigger reindex via Recall API with GPU offload."""
     logger.info("🚀 Triggering GPU-accelerated reindex...")
     
-    headers = {
-        "Authorization": f"Bearer {RECALL_API_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    
     try:
         # Start full reindex with GPU offload
-        resp = requests.post(
-            f"{RECALL_API_URL}/index/start",
+        resp = SESSION.post(
+            START_URL,
             json={"full": True, "use_gpu": True},
-            headers=headers,
-            timeout=30
+            headers=JSON_HEADERS,
+            timeout=(5, 30)
         )
         
         if resp.status_code == 200:
@@ -219,55 +524,120 @@ def trigger_gpu_reindex():
         return False
 
 
+def _handle_progress(data: dict, last_processed: int):
+    """
+    Inspect one progress payload, logging changes.
+    Returns (result, last_processed) where result is (success, processed) once
+    the job has finished, or None while it is still running.
+    """
+    status = data.get("status", "unknown")
+    processed = data.get("processed", 0)
+    total = data.get("total", 0)
+    
+    # Check if job completed (status is "idle" or "completed", not "running")
+    if status != "running":
+        if processed > 0:
+            logger.info(f"✅ Indexing complete! Processed {processed} files")
+            return (True, processed), last_processed
+        elif total == 0 and processed == 0:
+            # Job started but found no files - this is an error
+            logger.error(f"❌ Indexing completed but 0 files processed! Check vault path.")
+            return (False, 0), last_processed
+        else:
+            logger.info(f"✅ Indexing complete! Processed {processed} files")
+            return (True, processed), last_processed
+    
+    # Still running - log progress
+    percent = data.get("percent", 0)
+    eta = data.get("eta_human", "unknown")
+    current = data.get("current_file", "")[:50]
+    
+    # Only log if progress changed
+    if processed != last_processed:
+        logger.info(f"Progress: {percent:.1f}% ({processed}/{total}) | ETA: {eta} | {current}")
+        last_processed = processed
+    return None, last_processed
+
+
+def _stream_index_progress(start: float):
+    """
+    Follow /index/progress/stream (Server-Sent Events) until the job finishes.
+    Returns (result, last_processed); result is None when the server has no SSE
+    support or the stream dropped, so the caller should fall back to polling.
+    """
+    last_processed = 0
+    try:
+        with SESSION.get(
+            PROGRESS_STREAM_URL,
+            headers=SSE_HEADERS,
+            stream=True,
+            # Server sends a keepalive every ~21s, so a silent minute means trouble
+            timeout=(10, 60)
+        ) as resp:
+            if resp.status_code in (404, 406):
+                logger.info("Progress stream not supported, falling back to polling")
+                return None, last_processed
+            resp.raise_for_status()
+            
+            data_lines = []
+            for line in resp.iter_lines(decode_unicode=True):
+                if time.time() - start >= GPU_INDEX_TIMEOUT:
+                    break
+                if line:
+                    # SSE field lines; ":" prefixed lines are comments/keepalives
+                    if line.startswith("data:"):
+                        data_lines.append(line[5:].lstrip())
+                    continue
+                if not data_lines:
+                    continue
+                data = json.loads("\n".join(data_lines))
+                data_lines = []
+                result, last_processed = _handle_progress(data, last_processed)
+                if result:
+                    return result, last_processed
+    except (requests.exceptions.RequestException, ValueError) as e:
+        logger.warning(f"Progress stream failed: {e}")
+    
+    return None, last_processed
+
+
 def wait_for_index_complete():
-    """Poll index progress until complete. Returns (success, files_processed)."""
+    """Follow index progress until complete. Returns (success, files_processed)."""
     logger.info("📊 Monitoring index progress...")
     
-    headers = {"Authorization": f"Bearer {RECALL_API_TOKEN}"}
     start = time.time()
-    last_processed = 0
+    
+    result, last_processed = _stream_index_progress(start)
+    if result:
+        return result
     
     while time.time() - start < GPU_INDEX_TIMEOUT:
         try:
-            resp = requests.get(
-                f"{RECALL_API_URL}/index/progress",
-                headers=headers,
-                timeout=10
+            # Long-poll: returns as soon as processed moves past last_processed
+            # or the job finishes, otherwise after LONG_POLL_WAIT seconds
+            asked_at = time.time()
+            resp = SESSION.get(
+                PROGRESS_URL,
+                headers=AUTH_HEADERS,
+                params={"wait": LONG_POLL_WAIT, "since": last_processed},
+                timeout=LONG_POLL_WAIT + 10
             )
             
             if resp.status_code == 200:
-                data = resp.json()
-                status = data.get("status", "unknown")
-                processed = data.get("processed", 0)
-                total = data.get("total", 0)
-                
-                # Check if job completed (status is "idle" or "completed", not "running")
-                if status != "running":
-                    if processed > 0:
-                        logger.info(f"✅ Indexing complete! Processed {processed} files")
-                        return True, processed
-                    elif total == 0 and processed == 0:
-                        # Job started but found no files - this is an error
-                        logger.error(f"❌ Indexing completed but 0 files processed! Check vault path.")
-                        return False, 0
-                    else:
-                        logger.info(f"✅ Indexing complete! Processed {processed} files")
-                        return True, processed
-                
-                # Still running - log progress
-                percent = data.get("percent", 0)
-                eta = data.get("eta_human", "unknown")
-                current = data.get("current_file", "")[:50]
-                
-                # Only log if progress changed
-                if processed != last_processed:
-                    logger.info(f"Progress: {percent:.1f}% ({processed}/{total}) | ETA: {eta} | {current}")
-                    last_processed = processed
+                previous = last_processed
+                result, last_processed = _handle_progress(resp.json(), last_processed)
+                if result:
+                    return result
+                if last_processed == previous and time.time() - asked_at < 1:
+                    # Unchanged and answered immediately: server without
+                    # long-poll support, fall back to interval polling
+                    time.sleep(POLL_INTERVAL)
+            else:
+                time.sleep(POLL_INTERVAL)
             
         except requests.exceptions.RequestException as e:
             logger.warning(f"Progress check failed: {e}")
-        
-        time.sleep(POLL_INTERVAL)
+            time.sleep(5)
     
     logger.error(f"❌ Indexing timed out after {GPU_INDEX_TIMEOUT}s")
     return False, last_processed
@@ -278,9 +648,9 @@ def shutdown_gpu_pc():
     logger.info("🔌 Shutting down GPU PC...")
     
     try:
-        resp = requests.post(
-            f"{SHUTDOWN_SERVER_URL}/shutdown",
-            headers={"Authorization": f"Bearer {SHUTDOWN_TOKEN}"},
+        resp = SESSION.post(
+            SHUTDOWN_URL,
+            headers=SHUTDOWN_HEADERS,
             timeout=10
         )
         
@@ -295,50 +665,73 @@ def shutdown_gpu_pc():
         return False
 
 
-def main():
-    # Parse arguments
-    parser = argparse.ArgumentParser(description="Daily Vault Sync - GPU-accelerated reindexing")
-    parser.add_argument("--force", "-f", action="store_true", 
-                        help="Force full reindex regardless of file changes")
-    parser.add_argument("--skip-shutdown", action="store_true",
-                        help="Don't shutdown GPU PC after indexing")
-    args = parser.parse_args()
-    
-    logger.info("=" * 60)
-    logger.info(f"🗓️  Daily Vault Sync - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    if args.force:
-        logger.info("⚡ FORCE MODE - will reindex all files")
-    logger.info("=" * 60)
-    
-    # Step 1: Reorganize vault (optional - skipped by default for flat structure)
+def reorganize_step():
+    """Step 1: reorganize the vault unless SKIP_REORGANIZE is set."""
     if SKIP_REORGANIZE:
         logger.info("⏭️  Skipping reorganization (SKIP_REORGANIZE=true)")
-    elif not run_reorganize():
+        return True
+    if not run_reorganize():
         logger.error("Reorganization failed, aborting")
-        return 1
+        return False
+    return True
+
+
+def wake_and_wait_gpu():
+    """Steps 3-4: wake the GPU PC and block until its Ollama answers."""
+    if not wake_gpu_pc():
+        logger.error("Failed to send WoL, aborting GPU reindex")
+        return False
+    if not wait_for_gpu_ollama():
+        logger.error("GPU Ollama not available, aborting")
+        return False
+    return True
+
+
+async def main_async(args):
+    # Step 2: Check if there are new files to index (skip check if --force).
+    # With a scan this runs before reorganizing so the GPU boot can overlap
+    # with it; anything the reorganize step creates is newer than the saved
+    # timestamp, so a quiet day's output is still picked up by the next run.
+    # The watcher's list has no timestamp: reorganize writes made after the
+    # claim would land in tomorrow's list and re-trigger a reindex of content
+    # indexed today, so reorganize first there.
+    reorganized = False
+    watcher_mode = not FALLBACK_POLL and (PENDING_INDEX_FILE.exists() or PENDING_INFLIGHT_FILE.exists())
+    if watcher_mode and not args.force:
+        if not await asyncio.to_thread(reorganize_step):
+            return 1
+        reorganized = True
+        if not SKIP_REORGANIZE:
+            await asyncio.sleep(WATCHER_SETTLE_SECONDS)
     
-    # Step 2: Check if there are new files to index (skip check if --force)
     if args.force:
         logger.info("🔄 Force mode: skipping new file check, will reindex everything")
         new_count = "all"
     else:
-        has_new_files, new_count, total_count = check_for_new_files()
+        has_new_files, new_count, total_count = await asyncio.to_thread(check_for_new_files)
         
         if not has_new_files:
+            if not reorganized and not await asyncio.to_thread(reorganize_step):
+                return 1
             logger.info("🎉 No new files to index - skipping GPU wake and reindex")
             logger.info("Daily vault sync completed (nothing to do)")
             return 0
         
         logger.info(f"📊 {new_count} files need indexing - proceeding with GPU reindex")
     
-    # Step 3: Wake GPU PC
-    if not wake_gpu_pc():
-        logger.error("Failed to send WoL, aborting GPU reindex")
+    # Steps 1, 3, 4: Reorganize the vault (if not done above) while the GPU PC boots
+    if reorganized:
+        gpu_ready = await asyncio.to_thread(wake_and_wait_gpu)
+    else:
+        reorganized, gpu_ready = await asyncio.gather(
+            asyncio.to_thread(reorganize_step),
+            asyncio.to_thread(wake_and_wait_gpu),
+        )
+    if not gpu_ready:
         return 1
-    
-    # Step 4: Wait for Ollama
-    if not wait_for_gpu_ollama():
-        logger.error("GPU Ollama not available, aborting")
+    if not reorganized:
+        if not args.skip_shutdown:
+            shutdown_gpu_pc()  # Woken for nothing
         return 1
     
     # Step 5: Trigger reindex
@@ -349,7 +742,7 @@ def main():
         return 1
     
     # Step 6: Wait for completion
-    success, files_processed = wait_for_index_complete()
+    success, files_processed = await asyncio.to_thread(wait_for_index_complete)
     
     # Step 7: Shutdown GPU PC (unless --skip-shutdown)
     if args.skip_shutdown:
@@ -373,5 +766,23 @@ def main():
     return 0
 
 
+def main():
+    # Parse arguments
+    parser = argparse.ArgumentParser(description="Daily Vault Sync - GPU-accelerated reindexing")
+    parser.add_argument("--force", "-f", action="store_true", 
+                        help="Force full reindex regardless of file changes")
+    parser.add_argument("--skip-shutdown", action="store_true",
+                        help="Don't shutdown GPU PC after indexing")
+    args = parser.parse_args()
+    
+    logger.info("=" * 60)
+    logger.info(f"🗓️  Daily Vault Sync - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    if args.force:
+        logger.info("⚡ FORCE MODE - will reindex all files")
+    logger.info("=" * 60)
+    
+    return asyncio.run(main_async(args))
+
+
 if __name__ == "__main__":
     sys.exit(main())
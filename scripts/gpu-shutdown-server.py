@@ -13,14 +13,24 @@ Install on GPU PC:
     sudo systemctl start gpu-shutdown
 """
 
+import os
+import hmac
+import socket
 import subprocess
 import json
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import logging
 
 PORT = 8765
 SECRET = os.environ.get("GPU_SHUTDOWN_SECRET", "changeme")
 
+# Response bodies never change, so encode them once
+_HEALTH_OK = json.dumps({"status": "ok", "service": "gpu-shutdown"}).encode()
+_USE_POST = json.dumps({"error": "Use POST /shutdown"}).encode()
+_NOT_FOUND = json.dumps({"error": "Not found"}).encode()
+_UNAUTHORIZED = json.dumps({"error": "Unauthorized"}).encode()
+_SHUTDOWN_OK = json.dumps({"success": True, "message": "Shutting down now"}).encode()
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -29,41 +39,55 @@ class ShutdownHandler(BaseHTTPRequestHandler):
     def log_message(self, format, *args):
         logger.info(f"{self.client_address[0]} - {format % args}")
     
-    def _send_json(self, data: dict, status: int = 200):
+    def _send_bytes(self, body: bytes, status: int = 200):
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Connection", "close")
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
     
     def do_GET(self):
         if self.path == "/health":
-            self._send_json({"status": "ok", "service": "gpu-shutdown"})
+            self._send_bytes(_HEALTH_OK)
         else:
-            self._send_json({"error": "Use POST /shutdown"}, 404)
+            self._send_bytes(_USE_POST, 404)
     
     def do_POST(self):
         if self.path != "/shutdown":
-            self._send_json({"error": "Not found"}, 404)
+            self._send_bytes(_NOT_FOUND, 404)
             return
         
-        # Check auth
+        # Check auth (constant-time, so the token can't be probed byte by byte)
         auth = self.headers.get("Authorization", "")
-        if auth != f"Bearer {SECRET}":
+        if not hmac.compare_digest(auth.encode(), f"Bearer {SECRET}".encode()):
             logger.warning(f"Unauthorized shutdown attempt from {self.client_address[0]}")
-            self._send_json({"error": "Unauthorized"}, 401)
+            self._send_bytes(_UNAUTHORIZED, 401)
             return
         
         logger.info("Shutdown requested - shutting down now...")
-        self._send_json({"success": True, "message": "Shutting down now"})
+        self._send_bytes(_SHUTDOWN_OK)
+        
+        # Make sure the response is on the wire before the machine goes down
+        try:
+            self.wfile.flush()
+            self.connection.shutdown(socket.SHUT_WR)
+        except OSError:
+            pass
         
-        # Shutdown after response is sent
+        # Shutdown after response is sent. Own session so systemd stopping this
+        # service can't kill shutdown before it arms; no inherited client socket
         subprocess.Popen(["sudo", "shutdown", "-h", "+0"], 
                         stdout=subprocess.DEVNULL, 
-                        stderr=subprocess.DEVNULL)
+                        stderr=subprocess.DEVNULL,
+                        close_fds=True,
+                        start_new_session=True)
 
 
 if __name__ == "__main__":
-    server = HTTPServer(("0.0.0.0", PORT), ShutdownHandler)
+    # One thread per request so a slow client can't hold up /health probes
+    server = ThreadingHTTPServer(("0.0.0.0", PORT), ShutdownHandler)
+    server.daemon_threads = True
     logger.info(f"Shutdown server running on port {PORT}")
     try:
         server.serve_forever()
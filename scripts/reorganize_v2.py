@@ -12,11 +12,15 @@ Run with --dry-run first to preview changes.
 import os
 import re
 import json
-import shutil
+import mmap
+import hashlib
+import string
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Set, Tuple, Optional
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 # Paths
 VAULT_PATH = Path(os.environ.get("VAULT_PATH", "./obsidian/work"))
@@ -26,6 +30,13 @@ INTERVIEWS_PATH = VAULT_PATH / "interviews"
 PERFORMANCE_PATH = VAULT_PATH / "performance"
 GRANOLA_PATH = VAULT_PATH / "Granola" / "Transcripts"
 
+# Script state lives next to the sync script's caches, not in the (synced) vault
+STATE_DIR = Path(__file__).parent.parent / "logs"
+# Content hashes of written summaries by vault-relative path (skips identical rewrites)
+SUMMARY_INDEX_PATH = STATE_DIR / ".reorganize_summary_index.json"
+# parse_daily_note() results by note filename, keyed on (mtime_ns, size)
+DAILY_CACHE_PATH = STATE_DIR / ".reorganize_daily_cache.json"
+
 # Person name canonicalization (variant -> canonical)
 PERSON_ALIASES = {
     # Vijay variants
@@ -124,13 +135,37 @@ KNOWN_PEOPLE = {
     'john', 'nobal',
 }
 
+# Exact-name lookup: every known person plus every alias -> canonical name.
+# Aliases go last so they win, as in the original alias-then-known check.
+# All keys are already valid slugs.
+_CANONICAL = {person: person for person in KNOWN_PEOPLE}
+_CANONICAL.update(PERSON_ALIASES)
+# Characters that slugify() leaves untouched
+_SLUG_CHARS = frozenset(string.ascii_lowercase + string.digits + '-')
+
+
+# Compiled once; these run for every meeting title in every daily note
+_SLUG_STRIP = re.compile(r'[^\w\s-]')
+_SLUG_WS = re.compile(r'[\s_]+')
+_SLUG_DASH = re.compile(r'-+')
+_TITLE_SUFFIX = re.compile(r'\s*[-/]\s*(weekly|11|1:1|sync|catch-?up).*$', re.IGNORECASE)
+_TITLE_SPLIT = re.compile(r'\s*[/<>|]+\s*')
+_GRANOLA_ID_RE = re.compile(rb'granola_id:\s*"?([^"\n]+)')
+
+# Meeting metadata line prefix ("**Key:**") -> metadata dict key
+_META_KEYS = {
+    b'**Granola ID': 'granola_id',
+    b'**Attendees': 'attendees',
+    b'**Created': 'created',
+}
+
 
 def slugify(text: str) -> str:
     """Convert text to safe filename slug."""
     text = text.lower()
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'-+', '-', text)
+    text = _SLUG_STRIP.sub('', text)
+    text = _SLUG_WS.sub('-', text)
+    text = _SLUG_DASH.sub('-', text)
     return text.strip('-')[:60]
 
 
@@ -138,71 +173,77 @@ def get_canonical_person(folder_name: str) -> Optional[str]:
     """Get canonical person name from folder name."""
     name = folder_name.lower()
     
-    # Check explicit aliases
-    if name in PERSON_ALIASES:
-        return PERSON_ALIASES[name]
-    
-    # Check if it's a known person directly
-    if name in KNOWN_PEOPLE:
-        return name
+    # Explicit alias or known person
+    canonical = _CANONICAL.get(name)
+    if canonical:
+        return canonical
     
     # Try to extract person name from folder name patterns
     # e.g., "anshul-dx" -> check if "anshul" is known
-    parts = name.split('-')
-    if parts[0] in KNOWN_PEOPLE:
-        return parts[0]
+    first = name.partition('-')[0]
+    if first in KNOWN_PEOPLE:
+        return first
     
     return None
 
 
-def parse_daily_note(content: str) -> List[Dict]:
-    """Parse a daily note file and extract individual meetings."""
+def _meeting_text(buf: bytearray, last: bool) -> str:
+    """Decode a finished meeting body, matching str.split('\\n') + join."""
+    text = buf.decode('utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n')
+    # Mid-file meetings end at the next header, without that line's newline
+    if not last and text.endswith('\n'):
+        text = text[:-1]
+    return text
+
+
+def parse_daily_note(note_path: Path) -> List[Dict]:
+    """Parse a daily note file and extract individual meetings.
+    
+    The note is mmap'ed and scanned as bytes; only header and metadata lines
+    (and each finished meeting body) get decoded.
+    """
     meetings = []
     current_meeting = None
-    current_lines = []
-    
-    lines = content.split('\n')
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i]
-        
-        # New meeting header: ## Title
-        if line.startswith('## ') and not line.startswith('## #'):
-            # Save previous meeting
-            if current_meeting:
-                current_meeting['content'] = '\n'.join(current_lines)
-                meetings.append(current_meeting)
-            
-            title = line[3:].strip()
-            current_meeting = {'title': title, 'metadata': {}}
-            current_lines = [line]
-            i += 1
-            
-            # Parse metadata lines
-            while i < len(lines) and lines[i].startswith('**'):
-                meta_line = lines[i]
-                current_lines.append(meta_line)
+    current_buf = bytearray()
+    in_metadata = False
+    
+    with open(note_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return meetings
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b''):
+                # New meeting header: ## Title
+                if line.startswith(b'## ') and not line.startswith(b'## #'):
+                    # Save previous meeting
+                    if current_meeting:
+                        current_meeting['content'] = _meeting_text(current_buf, last=False)
+                        meetings.append(current_meeting)
+                    
+                    title = line[3:].decode('utf-8').strip()
+                    current_meeting = {'title': title, 'metadata': {}}
+                    current_buf = bytearray(line)
+                    in_metadata = True
+                    continue
                 
-                # Extract metadata
-                if meta_line.startswith('**Granola ID:**'):
-                    current_meeting['metadata']['granola_id'] = meta_line.split(':**')[1].strip()
-                elif meta_line.startswith('**Attendees:**'):
-                    current_meeting['metadata']['attendees'] = meta_line.split(':**')[1].strip()
-                elif meta_line.startswith('**Created:**'):
-                    current_meeting['metadata']['created'] = meta_line.split(':**')[1].strip()
+                # Parse metadata lines directly below the header
+                if in_metadata:
+                    if line.startswith(b'**'):
+                        current_buf += line
+                        head, _, value = line.partition(b':**')
+                        key = _META_KEYS.get(head)
+                        if key:
+                            current_meeting['metadata'][key] = value.decode('utf-8').strip()
+                        continue
+                    in_metadata = False
                 
-                i += 1
-            continue
-        
-        if current_meeting:
-            current_lines.append(line)
-        
-        i += 1
+                if current_meeting:
+                    current_buf += line
     
     # Save last meeting
     if current_meeting:
-        current_meeting['content'] = '\n'.join(current_lines)
+        current_meeting['content'] = _meeting_text(current_buf, last=True)
         meetings.append(current_meeting)
     
     return meetings
@@ -210,14 +251,14 @@ def parse_daily_note(content: str) -> List[Dict]:
 
 def extract_people_from_title(title: str) -> List[str]:
     """Extract person names from meeting title."""
-    people = []
+    people = set()
     title_lower = title.lower()
     
     # Remove common suffixes
-    title_clean = re.sub(r'\s*[-/]\s*(weekly|11|1:1|sync|catch-?up).*$', '', title_lower, flags=re.IGNORECASE)
+    title_clean = _TITLE_SUFFIX.sub('', title_lower)
     
     # Split by common separators
-    parts = re.split(r'\s*[/<>|]+\s*', title_clean)
+    parts = _TITLE_SPLIT.split(title_clean)
     
     for part in parts:
         part = part.strip()
@@ -225,26 +266,40 @@ def extract_people_from_title(title: str) -> List[str]:
         if 'arnab' in part.lower():
             continue
         
-        # Check if this matches a known person
-        part_slug = slugify(part)
+        # Check if this matches a known person. Most parts are already a bare
+        # name or slug, which slugify() would return unchanged
+        if part in _CANONICAL:
+            part_slug = part
+        elif (set(part) <= _SLUG_CHARS and '--' not in part
+                and not part.startswith('-') and not part.endswith('-')):
+            part_slug = part[:60]
+        else:
+            part_slug = slugify(part)
         canonical = get_canonical_person(part_slug)
         if canonical:
-            people.append(canonical)
+            people.add(canonical)
         else:
             # Try first word
             first_word = part.split()[0] if part.split() else ''
             if first_word.lower() in KNOWN_PEOPLE:
-                people.append(first_word.lower())
+                people.add(first_word.lower())
     
-    return list(set(people))
+    return list(people)
+
+
+def _is_empty(path) -> bool:
+    """True if the directory has no entries (reads at most one)."""
+    with os.scandir(path) as it:
+        return next(it, None) is None
 
 
 def find_empty_folders(base_path: Path) -> List[Path]:
     """Find empty folders."""
     empty = []
-    for folder in base_path.iterdir():
-        if folder.is_dir() and not any(folder.iterdir()):
-            empty.append(folder)
+    with os.scandir(base_path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False) and _is_empty(entry.path):
+                empty.append(Path(entry.path))
     return empty
 
 
@@ -257,14 +312,16 @@ def analyze_people_folders() -> Dict:
         'empty': [],  # empty folders
     }
     
-    for folder in PEOPLE_PATH.iterdir():
-        if not folder.is_dir():
-            continue
-        
-        folder_name = folder.name
+    # scandir: the dir check comes from readdir, no stat per folder
+    with os.scandir(PEOPLE_PATH) as it:
+        entries = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+    
+    for entry in entries:
+        folder_name = entry.name
+        folder = Path(entry.path)
         
         # Check if empty
-        if not any(folder.iterdir()):
+        if _is_empty(entry.path):
             analysis['empty'].append(folder)
             continue
         
@@ -286,17 +343,62 @@ def analyze_people_folders() -> Dict:
     return analysis
 
 
-def analyze_daily_notes() -> Dict:
-    """Analyze daily notes and extract meetings."""
+def _load_state(path: Path) -> Dict:
+    """JSON state saved by _save_state(), or {} if missing or from another vault."""
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Entries are only valid for the vault they were written for
+    if not isinstance(data, dict) or data.get('vault') != str(VAULT_PATH.resolve()):
+        return {}
+    return data.get('entries', {})
+
+
+def _save_state(path: Path, entries: Dict, what: str):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({'vault': str(VAULT_PATH.resolve()), 'entries': entries}))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"⚠️  Could not save {what}: {e}")
+
+
+def analyze_daily_notes(save_cache: bool = False) -> Dict:
+    """Analyze daily notes and extract meetings.
+    
+    The parse cache is only written when save_cache is set, so previews
+    leave no files behind.
+    """
     analysis = {
         'by_date': {},  # date -> [meetings]
         'by_person': defaultdict(list),  # person -> [meetings with date]
     }
     
-    for note_file in sorted(DAILY_NOTES_PATH.glob('*.md')):
+    # Only notes whose mtime/size changed since the last run get re-parsed
+    cache = _load_state(DAILY_CACHE_PATH)
+    fresh_cache = {}
+    reparsed = False
+    
+    def load(note_file: Path):
+        st = note_file.stat()
+        cached = cache.get(note_file.name)
+        if cached and len(cached) == 3 and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return st, cached[2], False
+        return st, parse_daily_note(note_file), True
+    
+    # Notes are independent and reading them is I/O-bound, so stat/parse them
+    # on a pool; results come back in sorted order and are merged here
+    note_files = sorted(DAILY_NOTES_PATH.glob('*.md'))
+    with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 2) as pool:
+        loaded = list(pool.map(load, note_files))
+    
+    for note_file, (st, meetings, parsed) in zip(note_files, loaded):
         date = note_file.stem  # e.g., "2026-02-11"
-        content = note_file.read_text()
-        meetings = parse_daily_note(content)
+        reparsed |= parsed
+        fresh_cache[note_file.name] = (st.st_mtime_ns, st.st_size, meetings)
         
         analysis['by_date'][date] = meetings
         
@@ -309,49 +411,72 @@ def analyze_daily_notes() -> Dict:
                     'source_file': note_file
                 })
     
+    if save_cache and (reparsed or len(fresh_cache) != len(cache)):
+        _save_state(DAILY_CACHE_PATH, fresh_cache, "daily note cache")
+    
     return analysis
 
 
+def _emit(buf: List[str]):
+    """Write a section of output in one go and reset the buffer."""
+    if buf:
+        sys.stdout.write('\n'.join(buf) + '\n')
+        buf.clear()
+
+
 def print_analysis(people_analysis: Dict, daily_analysis: Dict):
     """Print analysis summary."""
-    print("=" * 60)
-    print("PEOPLE FOLDER ANALYSIS")
-    print("=" * 60)
+    out = []
+    out.append("=" * 60)
+    out.append("PEOPLE FOLDER ANALYSIS")
+    out.append("=" * 60)
     
-    print(f"\n📁 Empty folders to delete: {len(people_analysis['empty'])}")
+    out.append(f"\n📁 Empty folders to delete: {len(people_analysis['empty'])}")
     for folder in people_analysis['empty'][:10]:
-        print(f"   - {folder.name}")
+        out.append(f"   - {folder.name}")
     if len(people_analysis['empty']) > 10:
-        print(f"   ... and {len(people_analysis['empty']) - 10} more")
+        out.append(f"   ... and {len(people_analysis['empty']) - 10} more")
     
-    print(f"\n🚫 Non-person folders to relocate: {len(people_analysis['non_people'])}")
+    out.append(f"\n🚫 Non-person folders to relocate: {len(people_analysis['non_people'])}")
     for item in people_analysis['non_people']:
         dest = '/'.join(item['destination'])
-        print(f"   - {item['folder'].name} → {dest}/")
+        out.append(f"   - {item['folder'].name} → {dest}/")
     
-    print(f"\n👥 People with multiple folders (need consolidation):")
+    out.append(f"\n👥 People with multiple folders (need consolidation):")
     for person, folders in people_analysis['canonical_people'].items():
         if len(folders) > 1:
-            print(f"   - {person}: {[f.name for f in folders]}")
+            out.append(f"   - {person}: {[f.name for f in folders]}")
     
-    print(f"\n❓ Unknown folders: {len(people_analysis['unknown'])}")
+    out.append(f"\n❓ Unknown folders: {len(people_analysis['unknown'])}")
     for folder in people_analysis['unknown'][:15]:
-        print(f"   - {folder.name}")
+        out.append(f"   - {folder.name}")
     if len(people_analysis['unknown']) > 15:
-        print(f"   ... and {len(people_analysis['unknown']) - 15} more")
+        out.append(f"   ... and {len(people_analysis['unknown']) - 15} more")
     
-    print("\n" + "=" * 60)
-    print("DAILY NOTES ANALYSIS")
-    print("=" * 60)
+    out.append("\n" + "=" * 60)
+    out.append("DAILY NOTES ANALYSIS")
+    out.append("=" * 60)
     
-    print(f"\n📅 Total daily note files: {len(daily_analysis['by_date'])}")
-    print(f"👥 People mentioned in daily notes: {len(daily_analysis['by_person'])}")
+    out.append(f"\n📅 Total daily note files: {len(daily_analysis['by_date'])}")
+    out.append(f"👥 People mentioned in daily notes: {len(daily_analysis['by_person'])}")
     
     # Show people with meetings in daily notes
-    print(f"\n📊 Top people by meeting count in daily notes:")
+    out.append(f"\n📊 Top people by meeting count in daily notes:")
     sorted_people = sorted(daily_analysis['by_person'].items(), key=lambda x: len(x[1]), reverse=True)
     for person, meetings in sorted_people[:15]:
-        print(f"   - {person}: {len(meetings)} meetings")
+        out.append(f"   - {person}: {len(meetings)} meetings")
+    
+    _emit(out)
+
+
+def _folder_files(folder) -> Tuple[List[os.DirEntry], int]:
+    """Regular files directly inside folder, plus its total entry count.
+    
+    One readdir; DirEntry.is_file() answers from d_type, no stat per file.
+    """
+    with os.scandir(folder) as it:
+        entries = list(it)
+    return [e for e in entries if e.is_file()], len(entries)
 
 
 def consolidate_person_folders(canonical: str, folders: List[Path], dry_run: bool = True) -> List[str]:
@@ -369,25 +494,34 @@ def consolidate_person_folders(canonical: str, folders: List[Path], dry_run: boo
             continue  # Skip the target folder itself
         
         # Move all files from this folder to target
-        for file in folder.glob('*'):
-            if file.is_file():
-                target_file = target_folder / file.name
-                action = f"MOVE: {file} → {target_file}"
-                actions.append(action)
-                
-                if not dry_run:
-                    target_folder.mkdir(parents=True, exist_ok=True)
-                    if not target_file.exists():
-                        shutil.move(str(file), str(target_file))
-                    else:
-                        # Handle conflict - append suffix
-                        stem = target_file.stem
-                        suffix = target_file.suffix
-                        new_name = f"{stem}-from-{folder.name}{suffix}"
-                        shutil.move(str(file), str(target_folder / new_name))
+        files, n_entries = _folder_files(folder)
+        target_dir = str(target_folder)
+        for file in files:
+            actions.append(f"MOVE: {file.path} → {os.path.join(target_dir, file.name)}")
+        
+        if dry_run:
+            continue
+        
+        if files and not target_folder.exists() and len(files) == n_entries:
+            # Nothing to merge with and nothing left behind: one rename
+            os.rename(folder, target_folder)
+            actions.append(f"DELETE FOLDER: {folder}")
+            continue
+        
+        # Same filesystem, so a plain rename per file
+        for file in files:
+            target_folder.mkdir(parents=True, exist_ok=True)
+            target_file = os.path.join(target_dir, file.name)
+            if not os.path.exists(target_file):
+                os.rename(file.path, target_file)
+            else:
+                # Handle conflict - append suffix
+                stem, suffix = os.path.splitext(file.name)
+                new_name = f"{stem}-from-{folder.name}{suffix}"
+                os.rename(file.path, os.path.join(target_dir, new_name))
         
         # Remove empty folder
-        if not dry_run and not any(folder.iterdir()):
+        if _is_empty(folder):
             folder.rmdir()
             actions.append(f"DELETE FOLDER: {folder}")
     
@@ -409,76 +543,127 @@ def relocate_non_person_folders(non_people: List[Dict], dry_run: bool = True) ->
         actions.append(action)
         
         if not dry_run:
+            files, n_entries = _folder_files(source_folder)
+            
+            if not target_folder.exists() and len(files) == n_entries:
+                # Destination is new and the folder holds only files: one rename
+                target_folder.parent.mkdir(parents=True, exist_ok=True)
+                os.rename(source_folder, target_folder)
+                continue
+            
             target_folder.mkdir(parents=True, exist_ok=True)
             
-            # Move all files
-            for file in source_folder.glob('*'):
-                if file.is_file():
-                    target_file = target_folder / file.name
-                    if not target_file.exists():
-                        shutil.move(str(file), str(target_file))
-                    else:
-                        # Handle conflict
-                        stem = target_file.stem
-                        suffix = target_file.suffix
-                        new_name = f"{stem}-dup{suffix}"
-                        shutil.move(str(file), str(target_folder / new_name))
+            # Move all files (same filesystem, so a plain rename per file)
+            target_dir = str(target_folder)
+            for file in files:
+                target_file = os.path.join(target_dir, file.name)
+                if not os.path.exists(target_file):
+                    os.rename(file.path, target_file)
+                else:
+                    # Handle conflict
+                    stem, suffix = os.path.splitext(file.name)
+                    new_name = f"{stem}-dup{suffix}"
+                    os.rename(file.path, os.path.join(target_dir, new_name))
             
             # Remove empty source folder
-            if not any(source_folder.iterdir()):
+            if _is_empty(source_folder):
                 source_folder.rmdir()
     
     return actions
 
 
+def collect_granola_ids(person_folder: Path) -> Set[str]:
+    """granola_ids recorded in the frontmatter of a person folder's notes."""
+    seen = set()
+    try:
+        it = os.scandir(person_folder)
+    except OSError:
+        return seen
+    
+    with it:
+        for entry in it:
+            if not entry.name.endswith('.md') or not entry.is_file():
+                continue
+            # Frontmatter sits at the top; no need to read whole notes
+            with open(entry.path, 'rb') as f:
+                match = _GRANOLA_ID_RE.search(f.read(1024))
+            if match:
+                seen.add(match.group(1).strip().decode('utf-8', 'replace'))
+    return seen
+
+
 def sync_daily_to_people(daily_analysis: Dict, dry_run: bool = True) -> List[str]:
     """Copy meeting summaries from daily notes to people folders."""
     actions = []
+    # Content hashes of the summaries last written, by vault-relative path
+    summary_index = _load_state(SUMMARY_INDEX_PATH)
+    index_changed = False
     
     for person, meetings in daily_analysis['by_person'].items():
         person_folder = PEOPLE_PATH / person
         
+        # Meetings already copied into this person's folder
+        seen_ids = collect_granola_ids(person_folder)
+        # One listing per person instead of an exists()/mkdir() per meeting
+        try:
+            existing_names = set(os.listdir(person_folder))
+            folder_ready = True
+        except FileNotFoundError:
+            existing_names = set()
+            folder_ready = False
+        
         for item in meetings:
             date = item['date']
             meeting = item['meeting']
             
-            # Check if this meeting already exists in person folder
-            existing_files = list(person_folder.glob(f"{date}*.md")) if person_folder.exists() else []
-            
             # Create summary file name
             title_slug = slugify(meeting['title'])[:40]
             summary_file = person_folder / f"{date}-summary-{title_slug}.md"
             
             # Check if we already have this granola_id
             granola_id = meeting['metadata'].get('granola_id', '')
-            already_exists = False
+            if granola_id and granola_id in seen_ids:
+                continue
+            if granola_id:
+                seen_ids.add(granola_id)
             
-            for ef in existing_files:
-                if granola_id and granola_id in ef.read_text():
-                    already_exists = True
-                    break
+            # Build the summary content as encoded chunks (no joined str copy)
+            chunks = [
+                b'---\n',
+                f'title: "{meeting["title"]}"\n'.encode(),
+                f'date: "{date}"\n'.encode(),
+                b'type: "summary"\n',
+                f'granola_id: "{granola_id}"\n'.encode(),
+            ]
+            if meeting['metadata'].get('attendees'):
+                chunks.append(f'attendees: "{meeting["metadata"]["attendees"]}"\n'.encode())
+            chunks.append(b'---\n\n')
+            chunks.append(meeting['content'].encode())
             
-            if not already_exists:
-                action = f"CREATE SUMMARY: {summary_file.relative_to(VAULT_PATH)}"
-                actions.append(action)
-                
-                if not dry_run:
+            # Same content as the last write (and still on disk): nothing to do
+            hasher = hashlib.blake2b(digest_size=16)
+            for chunk in chunks:
+                hasher.update(chunk)
+            content_hash = hasher.hexdigest()
+            index_key = str(summary_file.relative_to(VAULT_PATH))
+            if summary_index.get(index_key) == content_hash and summary_file.name in existing_names:
+                continue
+            
+            action = f"CREATE SUMMARY: {index_key}"
+            actions.append(action)
+            
+            if not dry_run:
+                if not folder_ready:
                     person_folder.mkdir(parents=True, exist_ok=True)
-                    
-                    # Build the summary content
-                    content_lines = [
-                        "---",
-                        f'title: "{meeting["title"]}"',
-                        f'date: "{date}"',
-                        f'type: "summary"',
-                        f'granola_id: "{granola_id}"',
-                    ]
-                    if meeting['metadata'].get('attendees'):
-                        content_lines.append(f'attendees: "{meeting["metadata"]["attendees"]}"')
-                    content_lines.append("---\n")
-                    content_lines.append(meeting['content'])
-                    
-                    summary_file.write_text('\n'.join(content_lines))
+                    folder_ready = True
+                with summary_file.open('wb') as f:
+                    f.writelines(chunks)
+                existing_names.add(summary_file.name)
+                summary_index[index_key] = content_hash
+                index_changed = True
+    
+    if index_changed:
+        _save_state(SUMMARY_INDEX_PATH, summary_index, "summary index")
     
     return actions
 
@@ -496,57 +681,59 @@ def main():
     print("🔍 Analyzing vault structure...\n")
     
     people_analysis = analyze_people_folders()
-    daily_analysis = analyze_daily_notes()
+    daily_analysis = analyze_daily_notes(save_cache=args.apply and not args.analyze_only)
     
     print_analysis(people_analysis, daily_analysis)
     
     if args.analyze_only:
         return
     
-    print("\n" + "=" * 60)
-    print("PLANNED ACTIONS" + (" (DRY RUN)" if dry_run else " (APPLYING)"))
-    print("=" * 60)
+    out = []
+    out.append("\n" + "=" * 60)
+    out.append("PLANNED ACTIONS" + (" (DRY RUN)" if dry_run else " (APPLYING)"))
+    out.append("=" * 60)
     
     all_actions = []
     
     # 1. Delete empty folders
-    print("\n📁 Empty folder cleanup:")
+    out.append("\n📁 Empty folder cleanup:")
     for folder in people_analysis['empty']:
         action = f"DELETE EMPTY: {folder.name}"
         all_actions.append(action)
-        print(f"   {action}")
+        out.append(f"   {action}")
         if not dry_run:
             folder.rmdir()
+    _emit(out)
     
     # 2. Relocate non-person folders
-    print("\n🚚 Relocating non-person folders:")
+    out.append("\n🚚 Relocating non-person folders:")
     actions = relocate_non_person_folders(people_analysis['non_people'], dry_run)
     all_actions.extend(actions)
-    for action in actions:
-        print(f"   {action}")
+    out.extend(f"   {action}" for action in actions)
+    _emit(out)
     
     # 3. Consolidate duplicate person folders
-    print("\n👥 Person folder consolidation:")
+    out.append("\n👥 Person folder consolidation:")
     for person, folders in people_analysis['canonical_people'].items():
         if len(folders) > 1:
             actions = consolidate_person_folders(person, folders, dry_run)
             all_actions.extend(actions)
-            for action in actions:
-                print(f"   {action}")
+            out.extend(f"   {action}" for action in actions)
+    _emit(out)
     
     # 4. Sync daily summaries to people folders
-    print("\n📝 Daily summary sync to people folders:")
+    out.append("\n📝 Daily summary sync to people folders:")
     actions = sync_daily_to_people(daily_analysis, dry_run)
     all_actions.extend(actions)
-    for action in actions[:20]:
-        print(f"   {action}")
+    out.extend(f"   {action}" for action in actions[:20])
     if len(actions) > 20:
-        print(f"   ... and {len(actions) - 20} more")
+        out.append(f"   ... and {len(actions) - 20} more")
     
-    print(f"\n{'=' * 60}")
-    print(f"Total actions: {len(all_actions)}")
+    out.append(f"\n{'=' * 60}")
+    out.append(f"Total actions: {len(all_actions)}")
     if dry_run:
-        print("Run with --apply to execute these changes")
+        out.append("Run with --apply to execute these changes")
+    _emit(out)
 
 
 if __name__ == '__main__':
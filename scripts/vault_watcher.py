@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Vault Watcher - inotify sidecar for daily_vault_sync.py
+
+Watches the Obsidian vault and appends changed .md paths to logs/.pending_index,
+so the daily sync can read that list instead of walking the whole vault.
+
+The sync claims the file by renaming it; the watcher recreates it (empty) within
+a few seconds. An empty file means "watcher alive, nothing changed". A "*" line
+means events may have been lost (watcher restart, inotify queue overflow) and the
+sync falls back to a full scan.
+
+Linux only. Requires inotify_simple:
+    pip install inotify_simple
+
+Usage:
+    OBSIDIAN_WORK_PATH=/path/to/vault python3 vault_watcher.py
+
+Does not work on NFS/CIFS mounts (no inotify events for remote changes) - run the
+sync with FALLBACK_POLL=true there instead.
+"""
+
+import os
+import sys
+import logging
+from pathlib import Path
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:
+    INotify = None
+
+SCRIPT_DIR = Path(__file__).parent
+OBSIDIAN_WORK_PATH = Path(os.environ.get("OBSIDIAN_WORK_PATH", "./obsidian/work"))
+PENDING_FILE = SCRIPT_DIR.parent / "logs" / ".pending_index"
+FULL_SCAN_MARKER = "*"
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+class VaultWatcher:
+    """Recursive inotify watch over the vault, feeding PENDING_FILE."""
+
+    def __init__(self, root: Path):
+        self.root = str(root)
+        self.inotify = INotify()
+        self.mask = flags.MODIFY | flags.CREATE | flags.MOVED_TO
+        self.watches = {}  # wd -> directory path
+        self.seen = set()  # paths already written to the current PENDING_FILE
+
+    def add_tree(self, top: str):
+        """Watch top and every directory below it."""
+        for dirpath, dirnames, _ in os.walk(top):
+            dirnames[:] = [d for d in dirnames if not d.startswith('.')]
+            try:
+                wd = self.inotify.add_watch(dirpath, self.mask)
+                self.watches[wd] = dirpath
+            except OSError as e:
+                logger.warning(f"Cannot watch {dirpath}: {e}")
+
+    def ensure_pending_file(self):
+        """Recreate PENDING_FILE after the sync claimed it."""
+        try:
+            os.close(os.open(PENDING_FILE, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+        except FileExistsError:
+            return
+        self.seen.clear()
+
+    def record(self, changed: list):
+        """Append entries not yet in the current PENDING_FILE to it.
+
+        The sync can claim (rename) the file at any point, so creation and
+        claims are detected on the descriptor actually written to.
+        """
+        while True:
+            try:
+                fd = os.open(PENDING_FILE, os.O_WRONLY | os.O_APPEND)
+            except FileNotFoundError:
+                try:
+                    fd = os.open(PENDING_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT | os.O_EXCL)
+                except FileExistsError:
+                    continue
+                # New file: everything seen went out with the claimed one
+                self.seen.clear()
+
+            with os.fdopen(fd, "a") as f:
+                fresh = [line for line in dict.fromkeys(changed) if line not in self.seen]
+                if not fresh:
+                    return
+                f.writelines(line + "\n" for line in fresh)
+                f.flush()
+                # Claimed mid-write: the sync may have read it without these lines
+                try:
+                    kept = os.stat(PENDING_FILE).st_ino == os.fstat(f.fileno()).st_ino
+                except FileNotFoundError:
+                    kept = False
+
+            if kept:
+                self.seen.update(fresh)
+                return
+            self.seen.clear()
+
+    def run(self):
+        PENDING_FILE.parent.mkdir(parents=True, exist_ok=True)
+        self.add_tree(self.root)
+        logger.info(f"👀 Watching {len(self.watches)} directories under {self.root}")
+
+        # Anything may have changed while we weren't running
+        self.ensure_pending_file()
+        self.record([FULL_SCAN_MARKER])
+
+        while True:
+            events = self.inotify.read(timeout=5000)
+            self.ensure_pending_file()
+
+            changed = []
+            for event in events:
+                if event.mask & flags.Q_OVERFLOW:
+                    logger.warning("inotify queue overflow - requesting full scan")
+                    changed.append(FULL_SCAN_MARKER)
+                    continue
+
+                parent = self.watches.get(event.wd)
+                if parent is None:
+                    continue
+                if event.mask & flags.IGNORED:
+                    del self.watches[event.wd]
+                    continue
+
+                path = os.path.join(parent, event.name)
+                if event.mask & flags.ISDIR:
+                    if event.mask & (flags.CREATE | flags.MOVED_TO) and not event.name.startswith('.'):
+                        # New subtree: watch it and pick up files already inside
+                        self.add_tree(path)
+                        for dirpath, _, filenames in os.walk(path):
+                            changed.extend(os.path.join(dirpath, n) for n in filenames if n.endswith(".md"))
+                    continue
+
+                if event.name.endswith(".md"):
+                    changed.append(path)
+
+            if changed:
+                self.record(changed)
+
+
+def main():
+    if INotify is None:
+        logger.error("inotify_simple is not installed (pip install inotify_simple)")
+        return 1
+    if not OBSIDIAN_WORK_PATH.is_dir():
+        logger.error(f"Vault not found: {OBSIDIAN_WORK_PATH}")
+        return 1
+
+    try:
+        VaultWatcher(OBSIDIAN_WORK_PATH).run()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
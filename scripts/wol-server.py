@@ -14,9 +14,11 @@ Endpoints:
     GET /status - Full status info
 """
 
-import subprocess
+import time
 import socket
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import functools
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
 import logging
 
@@ -34,50 +36,53 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# One broadcast-enabled UDP socket for every wake request
+_WOL_SOCK = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+_WOL_SOCK.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+
+
+@functools.lru_cache(maxsize=8)
+def _magic_packet(mac_address: str) -> bytes:
+    """6 x 0xFF followed by the MAC repeated 16 times."""
+    mac_bytes = bytes.fromhex(mac_address.replace(":", "").replace("-", ""))
+    return b'\xff' * 6 + mac_bytes * 16
+
+
 def send_wol(mac_address: str) -> bool:
-    """Send Wake-on-LAN magic packet."""
-    try:
-        # Try wakeonlan command with subnet broadcast IP
-        result = subprocess.run(
-            ["wakeonlan", "-i", GPU_BROADCAST_IP, mac_address],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-        if result.returncode == 0:
-            logger.info(f"WoL sent via wakeonlan -i {GPU_BROADCAST_IP} to {mac_address}")
-            return True
-    except FileNotFoundError:
-        pass  # wakeonlan not installed, try manual
-    except Exception as e:
-        logger.warning(f"wakeonlan failed: {e}")
-    
-    # Manual WoL packet to subnet broadcast
+    """Send Wake-on-LAN magic packet to the subnet broadcast address."""
     try:
-        mac_bytes = bytes.fromhex(mac_address.replace(":", ""))
-        magic = b'\xff' * 6 + mac_bytes * 16
-        
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-        sock.sendto(magic, (GPU_BROADCAST_IP, 9))
-        sock.close()
-        logger.info(f"WoL sent manually to {mac_address} via {GPU_BROADCAST_IP}")
+        _WOL_SOCK.sendto(_magic_packet(mac_address), (GPU_BROADCAST_IP, 9))
+        logger.info(f"WoL sent to {mac_address} via {GPU_BROADCAST_IP}")
         return True
     except Exception as e:
-        logger.error(f"Manual WoL failed: {e}")
+        logger.error(f"WoL failed: {e}")
         return False
 
 
+# Last reachability result; probes within the TTL reuse it
+_HC_CACHE = {'t': float('-inf'), 'v': False}
+_HC_TTL = 2.0
+# Held across the probe, so concurrent callers wait for one probe, not start more
+_HC_LOCK = threading.Lock()
+
+# Most handler threads alive at once; see BoundedThreadingHTTPServer
+MAX_WORKERS = 16
+
+
 def check_gpu_pc() -> bool:
     """Check if GPU PC is reachable (Ollama port)."""
-    try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(2)
-        result = sock.connect_ex((GPU_PC_IP, 11434))  # Ollama port
-        sock.close()
-        return result == 0
-    except:
-        return False
+    with _HC_LOCK:
+        now = time.monotonic()
+        if now - _HC_CACHE['t'] < _HC_TTL:
+            return _HC_CACHE['v']
+        
+        try:
+            socket.create_connection((GPU_PC_IP, 11434), timeout=2).close()  # Ollama port
+            reachable = True
+        except OSError:
+            reachable = False
+        _HC_CACHE.update(t=time.monotonic(), v=reachable)
+        return reachable
 
 
 class WoLHandler(BaseHTTPRequestHandler):
@@ -132,8 +137,37 @@ class WoLHandler(BaseHTTPRequestHandler):
             self._send_json({"error": "Not found"}, 404)
 
 
+class BoundedThreadingHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that runs at most MAX_WORKERS handler threads.
+    
+    A slot is taken before the thread is started, so once all are busy the
+    accept loop waits and new connections queue in the listen backlog
+    instead of each getting a thread.
+    """
+    daemon_threads = True
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._slots = threading.BoundedSemaphore(MAX_WORKERS)
+    
+    def process_request(self, request, client_address):
+        self._slots.acquire()
+        try:
+            super().process_request(request, client_address)
+        except BaseException:
+            self._slots.release()
+            raise
+    
+    def process_request_thread(self, request, client_address):
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            self._slots.release()
+
+
 if __name__ == "__main__":
-    server = HTTPServer(("0.0.0.0", PORT), WoLHandler)
+    # Threaded, so a slow health probe against a down GPU PC can't block /wake
+    server = BoundedThreadingHTTPServer(("0.0.0.0", PORT), WoLHandler)
     logger.info(f"WoL server starting on port {PORT}")
     logger.info(f"GPU PC: {GPU_PC_MAC} ({GPU_PC_IP}), broadcast: {GPU_BROADCAST_IP}")
     try:
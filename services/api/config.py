@@ -3,8 +3,9 @@ Configuration settings for Recall API
 Simplified: BM25 (FTS5) + Gemini Flash only. No Ollama, no vectors.
 """
 
+from functools import lru_cache, cached_property
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Tuple
 
 
 class Settings(BaseSettings):
@@ -44,9 +45,13 @@ class Settings(BaseSettings):
     class Config:
         env_file = ".env"
     
-    @property
-    def excluded_folders_list(self) -> List[str]:
-        return [f.strip() for f in self.excluded_folders.split(",") if f.strip()]
+    @cached_property
+    def excluded_folders_list(self) -> Tuple[str, ...]:
+        # Split once; read on every search result filter
+        return tuple(f.strip() for f in self.excluded_folders.split(",") if f.strip())
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load settings once per process (.env parse + validation)."""
+    return Settings()
@@ -4,20 +4,104 @@ FTS Index - SQLite FTS5 full-text search for note-rag
 Provides BM25 keyword search alongside vector search for hybrid retrieval.
 """
 
+import re
+import json
 import sqlite3
 import logging
 import hashlib
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_UPSERT_SQL = """
+    INSERT INTO fts_documents (file_path, file_hash, title, vault, category, people, date, content, mtime, size)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(file_path) DO UPDATE SET
+        file_hash = excluded.file_hash,
+        title = excluded.title,
+        vault = excluded.vault,
+        category = excluded.category,
+        people = excluded.people,
+        date = excluded.date,
+        content = excluded.content,
+        mtime = excluded.mtime,
+        size = excluded.size,
+        updated_at = CURRENT_TIMESTAMP
+    -- Unchanged rows are left alone, so the AU trigger doesn't re-index them
+    WHERE fts_documents.file_hash IS NOT excluded.file_hash
+        OR fts_documents.title IS NOT excluded.title
+        OR fts_documents.vault IS NOT excluded.vault
+        OR fts_documents.category IS NOT excluded.category
+        OR fts_documents.people IS NOT excluded.people
+        OR fts_documents.date IS NOT excluded.date
+        OR fts_documents.mtime IS NOT excluded.mtime
+        OR fts_documents.size IS NOT excluded.size
+"""
+
+# Read-only connections kept for search; WAL lets them run alongside the writer
+READER_POOL_SIZE = 4
+
+# BM25 column weights: file_path, title, content, people
+_RANK_FUNCTION = "bm25(1.0, 2.0, 1.0, 0.5)"
+
+# Remove FTS5 special chars that cause syntax errors
+# Keep alphanumeric, spaces, and basic punctuation
+# Added: ? ! . , ; ' for common query punctuation
+_FTS_SPECIAL_RE = re.compile(r'[":*^~()?!.,;\'\[\]{}]')
+
+
+@lru_cache(maxsize=1024)
+def _escape_fts_query(query: str) -> str:
+    """
+    Escape query for FTS5 to prevent syntax errors.
+    FTS5 interprets special chars: ':' (column), '-' (NOT), '*' (prefix), etc.
+    
+    Strategy:
+    - Single word: quote it for literal match
+    - Multiple words: join with OR for any-match (better for names)
+    - Remove special chars that break FTS5
+    """
+    cleaned = _FTS_SPECIAL_RE.sub(' ', query)
+    
+    # Split into words and filter empty
+    words = [w.strip() for w in cleaned.split() if w.strip()]
+    
+    if not words:
+        return '""'
+    
+    if len(words) == 1:
+        # Single word: quote for literal match, add prefix match for flexibility
+        return f'"{words[0]}" OR {words[0]}*'
+    
+    # Multiple words: OR them together for any-match
+    # Quote each word and also add prefix match
+    terms = []
+    for word in words:
+        # Add both exact and prefix match for each term
+        terms.append(f'"{word}"')
+        terms.append(f'{word}*')
+    
+    return " OR ".join(terms)
+
 
 class FTSIndex:
     """SQLite FTS5 full-text search index."""
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._bulk = False
+        self._sql_cache: Dict[tuple, str] = {}
+        
+        # self.conn is the single writer; reads borrow from the pool
+        self._write_lock = threading.RLock()
+        self._readers: queue.LifoQueue = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_count_lock = threading.Lock()
         
         # Ensure parent directory exists
         parent_dir = Path(db_path).parent
@@ -33,16 +117,28 @@ class FTSIndex:
                 logger.info(f"Using fallback FTS path: {db_path}")
         
         try:
-            self.conn = sqlite3.connect(db_path, check_same_thread=False)
-            self.conn.row_factory = sqlite3.Row
+            self.conn = self._connect(db_path)
             self._init_tables()
         except sqlite3.OperationalError as e:
             logger.warning(f"Could not open FTS at {db_path}: {e}, trying /tmp")
             self.db_path = "/tmp/fts_index.db"
-            self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            self.conn.row_factory = sqlite3.Row
+            self.conn = self._connect(self.db_path)
             self._init_tables()
     
+    @staticmethod
+    def _connect(db_path: str) -> sqlite3.Connection:
+        """Open a connection tuned for a read-heavy FTS workload."""
+        conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        # WAL: readers don't block on the indexer; NORMAL is durable enough with WAL
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+        conn.execute("PRAGMA cache_size=-65536")  # 64MB
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+    
     def _init_tables(self):
         """Create FTS5 virtual table if not exists."""
         # Main content table (for deduplication)
@@ -57,11 +153,28 @@ class FTSIndex:
                 people TEXT,
                 date TEXT,
                 content TEXT,
+                mtime REAL,
+                size INTEGER,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
         
-        # FTS5 virtual table
+        # Source file stat for incremental change detection (added later)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(fts_documents)")}
+        for column, decl in (("mtime", "REAL"), ("size", "INTEGER")):
+            if column not in columns:
+                self.conn.execute(f"ALTER TABLE fts_documents ADD COLUMN {column} {decl}")
+        
+        # FTS5 virtual table (external content: postings only, text stays in fts_documents)
+        existing_fts = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'documents_fts'"
+        ).fetchone()
+        if existing_fts and "content='fts_documents'" not in existing_fts[0]:
+            # Older standalone FTS table keeps its own copy of every document
+            logger.info("Migrating FTS table to external content")
+            self.conn.execute("DROP TABLE documents_fts")
+            existing_fts = None
+        
         self.conn.execute("""
             CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
                 file_path,
@@ -74,7 +187,76 @@ class FTSIndex:
             )
         """)
         
-        # Triggers to keep FTS in sync
+        if existing_fts is None:
+            # Fresh FTS table: index whatever fts_documents already holds
+            self.conn.execute("INSERT INTO documents_fts(documents_fts) VALUES('rebuild')")
+        
+        # Column weights live in the table's rank config, so queries can
+        # ORDER BY rank and take FTS5's built-in sort path
+        rank = self.conn.execute(
+            "SELECT v FROM documents_fts_config WHERE k = 'rank'"
+        ).fetchone()
+        if rank is None or rank[0] != _RANK_FUNCTION:
+            self.conn.execute(
+                "INSERT INTO documents_fts(documents_fts, rank) VALUES('rank', ?)",
+                (_RANK_FUNCTION,)
+            )
+        
+        # Sync triggers missing means a bulk load was cut short after its
+        # trigger drop was committed; the postings can't be trusted
+        has_triggers = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'fts_documents_ai'"
+        ).fetchone()
+        if existing_fts is not None and not has_triggers:
+            logger.info("FTS sync triggers missing, rebuilding FTS index")
+            self.conn.execute("INSERT INTO documents_fts(documents_fts) VALUES('rebuild')")
+        
+        self._create_triggers()
+        
+        # Normalized person -> document lookup for the person filter
+        has_doc_people = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'doc_people'"
+        ).fetchone()
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS doc_people (
+                doc_id INTEGER REFERENCES fts_documents(id) ON DELETE CASCADE,
+                person TEXT
+            )
+        """)
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_doc_people ON doc_people(person, doc_id)"
+        )
+        
+        # foreign_keys is off by default, so clean up with a trigger like the FTS sync
+        self.conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS fts_documents_people_ad AFTER DELETE ON fts_documents BEGIN
+                DELETE FROM doc_people WHERE doc_id = old.id;
+            END
+        """)
+        
+        if not has_doc_people:
+            # Existing index: fill from the people column
+            rows = self.conn.execute(
+                "SELECT id, people FROM fts_documents WHERE people NOT IN ('', '[]')"
+            ).fetchall()
+            self.conn.executemany(
+                "INSERT INTO doc_people (doc_id, person) VALUES (?, ?)",
+                [(row["id"], name) for row in rows
+                 for name in self._normalize_people(self._parse_people(row["people"]))]
+            )
+        
+        # First open: give the planner statistics to work with
+        has_stats = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+        ).fetchone()
+        if not has_stats:
+            self.conn.execute("ANALYZE")
+        
+        self.conn.commit()
+        logger.info(f"FTS index initialized at {self.db_path}")
+    
+    def _create_triggers(self):
+        """Triggers to keep FTS in sync (external-content delete/insert form)."""
         self.conn.execute("""
             CREATE TRIGGER IF NOT EXISTS fts_documents_ai AFTER INSERT ON fts_documents BEGIN
                 INSERT INTO documents_fts(rowid, file_path, title, content, people)
@@ -89,17 +271,151 @@ class FTSIndex:
             END
         """)
         
+        # Only re-index when an FTS column changed; vault/category/date-only
+        # updates leave the postings alone
+        au_sql = self.conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'fts_documents_au'"
+        ).fetchone()
+        if au_sql and "WHEN" not in au_sql[0]:
+            self.conn.execute("DROP TRIGGER fts_documents_au")
+        
         self.conn.execute("""
-            CREATE TRIGGER IF NOT EXISTS fts_documents_au AFTER UPDATE ON fts_documents BEGIN
+            CREATE TRIGGER IF NOT EXISTS fts_documents_au
+            AFTER UPDATE OF file_path, file_hash, title, content, people ON fts_documents
+            WHEN old.file_hash IS NOT new.file_hash
+                OR old.file_path IS NOT new.file_path
+                OR old.title IS NOT new.title
+                OR old.people IS NOT new.people
+            BEGIN
                 INSERT INTO documents_fts(documents_fts, rowid, file_path, title, content, people)
                 VALUES('delete', old.id, old.file_path, old.title, old.content, old.people);
                 INSERT INTO documents_fts(rowid, file_path, title, content, people)
                 VALUES (new.id, new.file_path, new.title, new.content, new.people);
             END
         """)
+    
+    @contextmanager
+    def _reader(self):
+        """Borrow a read connection, opening up to READER_POOL_SIZE on demand."""
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            with self._reader_count_lock:
+                create = self._reader_count < READER_POOL_SIZE
+                if create:
+                    self._reader_count += 1
+            if create:
+                try:
+                    conn = self._connect(self.db_path)
+                except Exception:
+                    with self._reader_count_lock:
+                        self._reader_count -= 1
+                    raise
+            else:
+                conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+    
+    def _commit(self):
+        """Commit, unless a bulk_load() transaction is open."""
+        if not self._bulk:
+            self.conn.commit()
+    
+    @contextmanager
+    def _write_batch(self):
+        """Run writes under the write lock as one unit: all applied or none.
         
-        self.conn.commit()
-        logger.info(f"FTS index initialized at {self.db_path}")
+        Inside bulk_load() a savepoint stands in for the commit, so a failed
+        batch is undone without discarding the rest of the load.
+        """
+        with self._write_lock:
+            if self._bulk:
+                self.conn.execute("SAVEPOINT write_batch")
+                try:
+                    yield
+                except BaseException:
+                    self.conn.execute("ROLLBACK TO write_batch")
+                    self.conn.execute("RELEASE write_batch")
+                    raise
+                self.conn.execute("RELEASE write_batch")
+            else:
+                try:
+                    yield
+                    self.conn.commit()
+                except BaseException:
+                    self.conn.rollback()
+                    raise
+    
+    @contextmanager
+    def bulk_load(self):
+        """Load many documents in one transaction with FTS triggers off.
+        
+        Writes inside the block skip the per-row FTS updates; the FTS index is
+        rebuilt once from fts_documents on exit. Raises RuntimeError if another
+        bulk load (or any write transaction) is still open.
+        """
+        with self._write_lock:
+            # Committing here would publish another load's rows without FTS
+            # postings (its triggers are dropped and its rebuild hasn't run)
+            if self._bulk or self.conn.in_transaction:
+                raise RuntimeError("A bulk load is already in progress")
+            self.conn.execute("BEGIN")
+            for trigger in ("fts_documents_ai", "fts_documents_au", "fts_documents_ad"):
+                self.conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+            self._bulk = True
+        try:
+            yield self
+        except BaseException:
+            # Rolls back the DROP TRIGGERs too
+            with self._write_lock:
+                self._bulk = False
+                self.conn.rollback()
+            raise
+        with self._write_lock:
+            self._bulk = False
+            try:
+                self.conn.execute("INSERT INTO documents_fts(documents_fts) VALUES('rebuild')")
+                self._create_triggers()
+                self.conn.commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+            # Table sizes changed a lot; refresh planner stats
+            self.conn.execute("PRAGMA optimize")
+        logger.info("FTS index rebuilt after bulk load")
+    
+    @staticmethod
+    def _parse_people(value: Optional[str]) -> List[str]:
+        """people column -> list. JSON array; rows written before that are ", "-joined."""
+        if not value:
+            return []
+        if value[0] == "[":
+            return json.loads(value)
+        return value.split(", ")
+    
+    @staticmethod
+    def _normalize_people(people: List[str]) -> List[str]:
+        """Lowercased, de-duplicated person names for doc_people."""
+        return list(dict.fromkeys(p.strip().lower() for p in people if p.strip()))
+    
+    @staticmethod
+    def _document_row(
+        file_path: str,
+        title: str,
+        content: str,
+        vault: str,
+        category: str = "",
+        people: List[str] = None,
+        date: str = None,
+        mtime: float = None,
+        size: int = None
+    ) -> tuple:
+        """Parameters for _UPSERT_SQL."""
+        # Change detection only, not security: blake2b is faster than md5 here
+        file_hash = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+        return (file_path, file_hash, title, vault, category, json.dumps(people or []), date, content, mtime, size)
     
     def upsert_document(
         self,
@@ -109,68 +425,116 @@ class FTSIndex:
         vault: str,
         category: str = "",
         people: List[str] = None,
-        date: str = None
+        date: str = None,
+        mtime: float = None,
+        size: int = None
     ) -> bool:
         """Insert or update a document in the FTS index."""
-        file_hash = hashlib.md5(content.encode()).hexdigest()
-        people_str = ", ".join(people or [])
-        
         try:
-            self.conn.execute("""
-                INSERT INTO fts_documents (file_path, file_hash, title, vault, category, people, date, content)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ON CONFLICT(file_path) DO UPDATE SET
-                    file_hash = excluded.file_hash,
-                    title = excluded.title,
-                    vault = excluded.vault,
-                    category = excluded.category,
-                    people = excluded.people,
-                    date = excluded.date,
-                    content = excluded.content,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (file_path, file_hash, title, vault, category, people_str, date, content))
-            self.conn.commit()
+            with self._write_batch():
+                cursor = self.conn.execute(
+                    _UPSERT_SQL + "RETURNING id",
+                    self._document_row(file_path, title, content, vault, category, people, date, mtime, size)
+                )
+                row = cursor.fetchone()
+                
+                if row is not None:
+                    doc_id = row[0]
+                    self.conn.execute("DELETE FROM doc_people WHERE doc_id = ?", (doc_id,))
+                    self.conn.executemany(
+                        "INSERT INTO doc_people (doc_id, person) VALUES (?, ?)",
+                        [(doc_id, name) for name in self._normalize_people(people or [])]
+                    )
             return True
         except Exception as e:
             logger.error(f"Error upserting document {file_path}: {e}")
             return False
     
-    def _escape_fts_query(self, query: str) -> str:
+    def upsert_documents(self, docs: Iterable[Dict]) -> int:
         """
-        Escape query for FTS5 to prevent syntax errors.
-        FTS5 interprets special chars: ':' (column), '-' (NOT), '*' (prefix), etc.
+        Insert or update many documents with one executemany and one commit.
         
-        Strategy:
-        - Single word: quote it for literal match
-        - Multiple words: join with OR for any-match (better for names)
-        - Remove special chars that break FTS5
+        Each doc takes the upsert_document() keyword arguments. Returns the
+        number of documents written, or 0 if the batch failed (rolled back).
         """
-        import re
+        docs = list(docs)
+        if not docs:
+            return 0
+        
+        rows = [self._document_row(**doc) for doc in docs]
+        # Later docs for the same path overwrite earlier ones, as row upserts do
+        final = {doc["file_path"]: doc for doc in docs}
+        people_rows = [
+            (name, path)
+            for path, doc in final.items()
+            for name in self._normalize_people(doc.get("people") or [])
+        ]
         
-        # Remove FTS5 special chars that cause syntax errors
-        # Keep alphanumeric, spaces, and basic punctuation
-        # Added: ? ! . , ; ' for common query punctuation
-        cleaned = re.sub(r'[":*^~()?!.,;\'\[\]{}]', ' ', query)
+        try:
+            with self._write_batch():
+                self.conn.executemany(_UPSERT_SQL, rows)
+                self.conn.executemany(
+                    "DELETE FROM doc_people WHERE doc_id = (SELECT id FROM fts_documents WHERE file_path = ?)",
+                    [(path,) for path in final]
+                )
+                self.conn.executemany(
+                    "INSERT INTO doc_people (doc_id, person) SELECT id, ? FROM fts_documents WHERE file_path = ?",
+                    people_rows
+                )
+            return len(rows)
+        except Exception as e:
+            logger.error(f"Error upserting {len(rows)} documents: {e}")
+            return 0
+    
+    def _escape_fts_query(self, query: str) -> str:
+        """Escape query for FTS5 (see module-level _escape_fts_query)."""
+        return _escape_fts_query(query)
+    
+    def _filter_sql(
+        self,
+        vault: str,
+        person: Optional[str],
+        date_from: Optional[str],
+        date_to: Optional[str]
+    ) -> Tuple[List[str], List]:
+        """WHERE parts and params for the fts_documents filters (alias d)."""
+        where_parts = []
+        params = []
         
-        # Split into words and filter empty
-        words = [w.strip() for w in cleaned.split() if w.strip()]
+        if vault != "all":
+            where_parts.append("d.vault = ?")
+            params.append(vault)
         
-        if not words:
-            return '""'
+        if person:
+            where_parts.append(
+                "EXISTS (SELECT 1 FROM doc_people p WHERE p.doc_id = d.id AND p.person = ?)"
+            )
+            params.append(person.strip().lower())
         
-        if len(words) == 1:
-            # Single word: quote for literal match, add prefix match for flexibility
-            return f'"{words[0]}" OR {words[0]}*'
+        # Date range filtering
+        if date_from:
+            where_parts.append("d.date >= ?")
+            params.append(date_from)
         
-        # Multiple words: OR them together for any-match
-        # Quote each word and also add prefix match
-        terms = []
-        for word in words:
-            # Add both exact and prefix match for each term
-            terms.append(f'"{word}"')
-            terms.append(f'{word}*')
+        if date_to:
+            where_parts.append("d.date <= ?")
+            params.append(date_to)
         
-        return " OR ".join(terms)
+        return where_parts, params
+    
+    @staticmethod
+    def _row_to_result(row: sqlite3.Row) -> Dict:
+        return {
+            "file_path": row["file_path"],
+            "title": row["title"],
+            "vault": row["vault"],
+            "category": row["category"],
+            "people": FTSIndex._parse_people(row["people"]),
+            "date": row["date"],
+            "snippet": row["snippet"],
+            "score": abs(row["score"]),  # BM25 returns negative scores
+            "source": "bm25"
+        }
     
     def search(
         self,
@@ -188,7 +552,7 @@ class FTSIndex:
             query: Search query text
             vault: Filter by vault ("all", "work", "personal")
             limit: Max results to return
-            person: Filter by person name (partial match)
+            person: Filter by person name (case-insensitive exact match)
             date_from: Start date filter (YYYY-MM-DD format, inclusive)
             date_to: End date filter (YYYY-MM-DD format, inclusive)
         
@@ -200,32 +564,137 @@ class FTSIndex:
         # Escape query for FTS5 syntax
         fts_query = self._escape_fts_query(query)
         
-        # Build WHERE clause
-        where_parts = ["documents_fts MATCH ?"]
-        params = [fts_query]
+        # Filters apply to fts_documents, outside the MATCH
+        where_parts, params = self._filter_sql(vault, person, date_from, date_to)
         
-        if vault != "all":
-            where_parts.append("d.vault = ?")
-            params.append(vault)
+        # Over-fetch candidates when filtering so enough survive the WHERE
+        candidates = limit * 10 if where_parts else limit
         
-        if person:
-            where_parts.append("d.people LIKE ?")
-            params.append(f"%{person}%")
+        # One SQL text per filter combination, so sqlite3's statement cache
+        # hands back the already-prepared statement
+        key = ("search", *where_parts)
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            where_clause = f"WHERE {' AND '.join(where_parts)}" if where_parts else ""
+            # Run the MATCH on its own in a CTE: mixing it with column filters
+            # in one WHERE can make the planner scan instead of using FTS
+            sql = self._sql_cache[key] = f"""
+                WITH fts_matches AS (
+                    SELECT
+                        rowid,
+                        snippet(documents_fts, 2, '<mark>', '</mark>', '...', 64) as snippet,
+                        rank as score
+                    FROM documents_fts
+                    WHERE documents_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                )
+                SELECT 
+                    d.file_path,
+                    d.title,
+                    d.vault,
+                    d.category,
+                    d.people,
+                    d.date,
+                    fm.snippet,
+                    fm.score
+                FROM fts_matches fm
+                JOIN fts_documents d ON d.id = fm.rowid
+                {where_clause}
+                ORDER BY fm.score
+                LIMIT ?
+            """
         
-        # Date range filtering
-        if date_from:
-            where_parts.append("d.date >= ?")
-            params.append(date_from)
+        try:
+            with self._reader() as conn:
+                rows = conn.execute(sql, [fts_query, candidates, *params, limit]).fetchall()
+            return [self._row_to_result(row) for row in rows]
+            
+        except sqlite3.OperationalError as e:
+            # Handle invalid FTS query syntax
+            if "fts5: syntax error" in str(e):
+                logger.warning(f"Invalid FTS query: {query}")
+                return []
+            raise
+    
+    def search_boosted(
+        self,
+        name_query: str,
+        query: str,
+        vault: str = "all",
+        limit: int = 30,
+        person: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        name_boost: float = 3.0
+    ) -> List[Dict]:
+        """
+        Two BM25 searches blended in one statement.
         
-        if date_to:
-            where_parts.append("d.date <= ?")
-            params.append(date_to)
+        Runs name_query (no person filter) and query (with person filter) each
+        up to limit hits, then merges by document: score is
+        name_boost * name_score + query_score, and the name search's snippet
+        wins when both matched. Same result shape as search(), best first.
+        """
+        name_fts = self._escape_fts_query(name_query)
+        full_fts = self._escape_fts_query(query)
         
-        where_clause = " AND ".join(where_parts)
-        params.append(limit)
+        name_parts, name_params = self._filter_sql(vault, None, date_from, date_to)
+        full_parts, full_params = self._filter_sql(vault, person, date_from, date_to)
+        name_candidates = limit * 10 if name_parts else limit
+        full_candidates = limit * 10 if full_parts else limit
         
-        try:
-            cursor = self.conn.execute(f"""
+        key = ("boosted", tuple(name_parts), tuple(full_parts))
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            name_where = f"WHERE {' AND '.join(name_parts)}" if name_parts else ""
+            full_where = f"WHERE {' AND '.join(full_parts)}" if full_parts else ""
+            sql = self._sql_cache[key] = f"""
+                WITH name_matches AS (
+                    SELECT
+                        rowid,
+                        snippet(documents_fts, 2, '<mark>', '</mark>', '...', 64) as snippet,
+                        rank as score
+                    FROM documents_fts
+                    WHERE documents_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                ),
+                full_matches AS (
+                    SELECT
+                        rowid,
+                        snippet(documents_fts, 2, '<mark>', '</mark>', '...', 64) as snippet,
+                        rank as score
+                    FROM documents_fts
+                    WHERE documents_fts MATCH ?
+                    ORDER BY rank
+                    LIMIT ?
+                ),
+                hits AS (
+                    SELECT * FROM (
+                        SELECT fm.rowid, fm.snippet, ? * abs(fm.score) as score, 0 as pass
+                        FROM name_matches fm
+                        JOIN fts_documents d ON d.id = fm.rowid
+                        {name_where}
+                        ORDER BY fm.score
+                        LIMIT ?
+                    )
+                    UNION ALL
+                    SELECT * FROM (
+                        SELECT fm.rowid, fm.snippet, abs(fm.score) as score, 1 as pass
+                        FROM full_matches fm
+                        JOIN fts_documents d ON d.id = fm.rowid
+                        {full_where}
+                        ORDER BY fm.score
+                        LIMIT ?
+                    )
+                ),
+                merged AS (
+                    -- snippet is a bare column: taken from the MIN(pass) row
+                    SELECT rowid, snippet, MIN(pass) as first_pass, SUM(score) as score
+                    FROM hits
+                    GROUP BY rowid
+                )
                 SELECT 
                     d.file_path,
                     d.title,
@@ -233,63 +702,61 @@ class FTSIndex:
                     d.category,
                     d.people,
                     d.date,
-                    snippet(documents_fts, 2, '<mark>', '</mark>', '...', 64) as snippet,
-                    bm25(documents_fts, 1.0, 2.0, 1.0, 0.5) as score
-                FROM documents_fts
-                JOIN fts_documents d ON d.id = documents_fts.rowid
-                WHERE {where_clause}
-                ORDER BY score
-                LIMIT ?
-            """, params)
-            
-            results = []
-            for row in cursor.fetchall():
-                results.append({
-                    "file_path": row["file_path"],
-                    "title": row["title"],
-                    "vault": row["vault"],
-                    "category": row["category"],
-                    "people": row["people"].split(", ") if row["people"] else [],
-                    "date": row["date"],
-                    "snippet": row["snippet"],
-                    "score": abs(row["score"]),  # BM25 returns negative scores
-                    "source": "bm25"
-                })
-            
-            return results
+                    m.snippet,
+                    m.score
+                FROM merged m
+                JOIN fts_documents d ON d.id = m.rowid
+                ORDER BY m.score DESC
+            """
+        
+        try:
+            with self._reader() as conn:
+                rows = conn.execute(sql, [
+                    name_fts, name_candidates, full_fts, full_candidates,
+                    name_boost, *name_params, limit,
+                    *full_params, limit,
+                ]).fetchall()
+            return [self._row_to_result(row) for row in rows]
             
         except sqlite3.OperationalError as e:
-            # Handle invalid FTS query syntax
             if "fts5: syntax error" in str(e):
-                logger.warning(f"Invalid FTS query: {query}")
+                logger.warning(f"Invalid FTS query: {name_query!r} / {query!r}")
                 return []
             raise
     
     def get_document_count(self, vault: str = "all") -> int:
         """Get number of indexed documents."""
-        if vault == "all":
-            cursor = self.conn.execute("SELECT COUNT(*) FROM fts_documents")
-        else:
-            cursor = self.conn.execute(
-                "SELECT COUNT(*) FROM fts_documents WHERE vault = ?", 
-                (vault,)
-            )
-        return cursor.fetchone()[0]
+        with self._reader() as conn:
+            if vault == "all":
+                cursor = conn.execute("SELECT COUNT(*) FROM fts_documents")
+            else:
+                cursor = conn.execute(
+                    "SELECT COUNT(*) FROM fts_documents WHERE vault = ?", 
+                    (vault,)
+                )
+            return cursor.fetchone()[0]
+    
+    def get_indexed_stats(self) -> Dict[str, Tuple[Optional[float], Optional[int]]]:
+        """Map file_path -> (mtime, size) recorded when the file was last indexed."""
+        with self._reader() as conn:
+            rows = conn.execute("SELECT file_path, mtime, size FROM fts_documents").fetchall()
+        return {row[0]: (row[1], row[2]) for row in rows}
     
     def delete_document(self, file_path: str, vault: str = None) -> bool:
         """Remove a document from the FTS index."""
         try:
-            if vault:
-                self.conn.execute(
-                    "DELETE FROM fts_documents WHERE file_path = ? AND vault = ?",
-                    (file_path, vault)
-                )
-            else:
-                self.conn.execute(
-                    "DELETE FROM fts_documents WHERE file_path = ?",
-                    (file_path,)
-                )
-            self.conn.commit()
+            with self._write_lock:
+                if vault:
+                    self.conn.execute(
+                        "DELETE FROM fts_documents WHERE file_path = ? AND vault = ?",
+                        (file_path, vault)
+                    )
+                else:
+                    self.conn.execute(
+                        "DELETE FROM fts_documents WHERE file_path = ?",
+                        (file_path,)
+                    )
+                self._commit()
             return True
         except Exception as e:
             logger.error(f"Error deleting document {file_path}: {e}")
@@ -297,9 +764,19 @@ class FTSIndex:
     
     def clear_vault(self, vault: str):
         """Remove all documents from a vault."""
-        self.conn.execute("DELETE FROM fts_documents WHERE vault = ?", (vault,))
-        self.conn.commit()
+        with self._write_lock:
+            self.conn.execute("DELETE FROM fts_documents WHERE vault = ?", (vault,))
+            self._commit()
     
     def close(self):
-        """Close the database connection."""
+        """Close the database connections."""
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        try:
+            self.conn.execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
         self.conn.close()
@@ -6,17 +6,52 @@ No embeddings, no vectors, no GPU needed.
 
 import os
 import re
+import asyncio
 import logging
 import hashlib
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Callable
+from typing import Optional, List, Callable, Iterator
 
 from config import Settings
 from fts_index import FTSIndex
 
 logger = logging.getLogger(__name__)
 
+# Date handling for YYYY-MM-DD filename prefixes
+DATE_PREFIX_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+DATE_PREFIX_STRIP_RE = re.compile(r'^\d{4}-\d{2}-\d{2}[-_\s]*')
+EXTRA_BLANK_LINES_RE = re.compile(r'\n{3,}')
+
+# Reading and chunking block on disk I/O; run them off the event loop so
+# search requests stay responsive during a reindex. Up to PREPARE_WORKERS
+# files are prepared at once
+PREPARE_WORKERS = 4
+_executor = ThreadPoolExecutor(max_workers=PREPARE_WORKERS, thread_name_prefix="indexer")
+
+# Chunks buffered across files before one upsert_documents() call
+WRITE_BATCH_SIZE = 512
+
+
+def _scan_markdown(root: Path) -> Iterator[os.DirEntry]:
+    """Yield .md entries under root, skipping dot files and dot directories."""
+    # scandir hands back type info from readdir, so no stat() per entry
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.endswith('.md'):
+                        yield entry
+        except OSError as e:
+            logger.warning(f"Cannot scan {e.filename}: {e.strerror}")
+
 
 class Indexer:
     """FTS-only indexer for Obsidian vault files."""
@@ -53,7 +88,7 @@ class Indexer:
         category = ""
         
         # Extract date from filename (YYYY-MM-DD prefix)
-        date_match = re.match(r'(\d{4}-\d{2}-\d{2})', file_path.stem)
+        date_match = DATE_PREFIX_RE.match(file_path.stem)
         if date_match:
             date = date_match.group(1)
         
@@ -66,7 +101,7 @@ class Indexer:
         
         # Clean title
         if date:
-            title = re.sub(r'^\d{4}-\d{2}-\d{2}[-_\s]*', '', title).strip()
+            title = DATE_PREFIX_STRIP_RE.sub('', title).strip()
         if not title:
             title = file_path.stem
         
@@ -84,7 +119,7 @@ class Indexer:
         for phrase in self.noise_phrases:
             content = content.replace(phrase, "")
         # Clean up extra whitespace
-        content = re.sub(r'\n{3,}', '\n\n', content)
+        content = EXTRA_BLANK_LINES_RE.sub('\n\n', content)
         return content.strip()
     
     def _chunk_content(self, content: str, is_transcript: bool = False) -> List[str]:
@@ -122,38 +157,21 @@ class Indexer:
             if not vault_path.exists():
                 logger.warning(f"Vault path does not exist: {vault_path}")
                 continue
-            for root, dirs, files in os.walk(vault_path):
-                # Skip hidden dirs
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-                for fname in files:
-                    if fname.endswith('.md') and not fname.startswith('.'):
-                        fpath = Path(root) / fname
-                        all_files.append((vault_name, fpath))
+            all_files.extend((vault_name, Path(entry.path)) for entry in _scan_markdown(vault_path))
         
         total = len(all_files)
         logger.info(f"Full reindex: {total} files across {len(vaults_to_index)} vaults")
         
-        # Clear existing FTS data
-        for vault_name, _ in vaults_to_index:
-            try:
-                self.fts_index.clear_vault(vault_name)
-            except Exception as e:
-                logger.warning(f"Could not clear FTS for {vault_name}: {e}")
-        
-        for i, (vault_name, fpath) in enumerate(all_files):
-            if self._is_cancelled():
-                logger.info("Indexing cancelled")
-                break
+        # One transaction with FTS triggers off; FTS is rebuilt once at the end
+        with self.fts_index.bulk_load():
+            # Clear existing FTS data
+            for vault_name, _ in vaults_to_index:
+                try:
+                    self.fts_index.clear_vault(vault_name)
+                except Exception as e:
+                    logger.warning(f"Could not clear FTS for {vault_name}: {e}")
             
-            try:
-                count = await self._index_file(fpath, vault_name)
-                total_indexed += count
-                
-                if progress_callback and i % 10 == 0:
-                    await progress_callback(i + 1, total, str(fpath.name))
-                    
-            except Exception as e:
-                logger.error(f"Error indexing {fpath}: {e}")
+            total_indexed = await self._index_files(all_files, progress_callback)
         
         if progress_callback:
             await progress_callback(total, total, "Complete")
@@ -172,42 +190,29 @@ class Indexer:
         if vault in ("all", "personal"):
             vaults_to_index.append(("personal", self.vault_paths["personal"]))
         
-        # Get existing indexed file mtimes from FTS
+        # (mtime, size) of each file as of its last index
         indexed_files = {}
         try:
-            indexed_files = self.fts_index.get_indexed_mtimes()
-        except Exception:
-            pass
+            indexed_files = self.fts_index.get_indexed_stats()
+        except Exception as e:
+            logger.warning(f"Could not load indexed file stats, reindexing all: {e}")
         
         files_to_index = []
         for vault_name, vault_path in vaults_to_index:
             if not vault_path.exists():
                 continue
-            for root, dirs, files in os.walk(vault_path):
-                dirs[:] = [d for d in dirs if not d.startswith('.')]
-                for fname in files:
-                    if fname.endswith('.md') and not fname.startswith('.'):
-                        fpath = Path(root) / fname
-                        mtime = os.path.getmtime(fpath)
-                        fpath_str = str(fpath)
-                        
-                        # Only index if new or modified
-                        if fpath_str not in indexed_files or mtime > indexed_files[fpath_str]:
-                            files_to_index.append((vault_name, fpath))
+            for entry in _scan_markdown(vault_path):
+                fpath = Path(entry.path)
+                st = entry.stat()
+                
+                # Only index if new or modified; same mtime and size means unchanged
+                if indexed_files.get(str(fpath)) != (st.st_mtime, st.st_size):
+                    files_to_index.append((vault_name, fpath))
         
         total = len(files_to_index)
         logger.info(f"Incremental index: {total} new/modified files")
         
-        for i, (vault_name, fpath) in enumerate(files_to_index):
-            if self._is_cancelled():
-                break
-            try:
-                count = await self._index_file(fpath, vault_name)
-                total_indexed += count
-                if progress_callback and i % 10 == 0:
-                    await progress_callback(i + 1, total, str(fpath.name))
-            except Exception as e:
-                logger.error(f"Error indexing {fpath}: {e}")
+        total_indexed = await self._index_files(files_to_index, progress_callback)
         
         if progress_callback:
             await progress_callback(total, total, "Complete")
@@ -215,16 +220,18 @@ class Indexer:
         logger.info(f"Incremental index complete: {total_indexed} chunks from {total} files")
         return total_indexed
     
-    async def _index_file(self, file_path: Path, vault_name: str) -> int:
-        """Index a single file into FTS."""
+    def _prepare_file(self, file_path: Path, vault_name: str) -> List[dict]:
+        """Read, clean and chunk a file into FTS rows (runs in _executor)."""
         try:
+            # Stat before reading: a write in between shows up as a newer mtime next run
+            st = file_path.stat()
             content = file_path.read_text(encoding="utf-8")
         except Exception as e:
             logger.error(f"Cannot read {file_path}: {e}")
-            return 0
+            return []
         
         if not content.strip():
-            return 0
+            return []
         
         metadata = self._extract_metadata(content, file_path)
         
@@ -233,21 +240,85 @@ class Indexer:
         if is_transcript:
             content = self._clean_transcript(content)
         
-        # Chunk and index
         chunks = self._chunk_content(content, is_transcript)
+        return [
+            {
+                "file_path": str(file_path),
+                "title": metadata["title"],
+                "content": chunk,
+                "vault": vault_name,
+                "category": metadata["category"],
+                "people": metadata["people"],
+                "date": metadata["date"],
+                "mtime": st.st_mtime,
+                "size": st.st_size,
+            }
+            for chunk in chunks
+        ]
+    
+    async def _index_files(self, files: List[tuple], progress_callback: Optional[Callable] = None) -> int:
+        """Index (vault_name, path) pairs, preparing the next files while one is written."""
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=4)
+        total = len(files)
+        
+        async def put(i: int, fpath: Path, future: asyncio.Future):
+            try:
+                docs = await future
+            except Exception as e:
+                logger.error(f"Error indexing {fpath}: {e}")
+                return
+            await queue.put((i, fpath, docs))
+        
+        async def produce():
+            # Sliding window: keep every worker busy, hand results on in file order
+            in_flight = deque()
+            try:
+                for i, (vault_name, fpath) in enumerate(files):
+                    if self._is_cancelled():
+                        logger.info("Indexing cancelled")
+                        break
+                    in_flight.append((i, fpath, loop.run_in_executor(_executor, self._prepare_file, fpath, vault_name)))
+                    if len(in_flight) >= PREPARE_WORKERS:
+                        await put(*in_flight.popleft())
+                while in_flight and not self._is_cancelled():
+                    await put(*in_flight.popleft())
+            finally:
+                for _, _, future in in_flight:
+                    future.cancel()
+                await asyncio.gather(*(future for _, _, future in in_flight), return_exceptions=True)
+                await queue.put(None)
         
-        for chunk in chunks:
+        def flush(pending: List[dict]) -> int:
             try:
-                self.fts_index.upsert_document(
-                    file_path=str(file_path),
-                    title=metadata["title"],
-                    content=chunk,
-                    vault=vault_name,
-                    category=metadata["category"],
-                    people=metadata["people"],
-                    date=metadata["date"],
-                )
+                return self.fts_index.upsert_documents(pending)
             except Exception as e:
-                logger.error(f"FTS upsert error for {file_path}: {e}")
+                logger.error(f"Error writing {len(pending)} chunks: {e}")
+                return 0
+        
+        async def consume() -> int:
+            indexed = 0
+            pending: List[dict] = []
+            while (item := await queue.get()) is not None:
+                i, fpath, docs = item
+                if self._is_cancelled():
+                    continue
+                
+                # Batch across files: fewer, larger executemany + commit rounds
+                pending.extend(docs)
+                if len(pending) >= WRITE_BATCH_SIZE:
+                    # SQLite write on a thread so API requests aren't held up
+                    indexed += await asyncio.to_thread(flush, pending)
+                    pending = []
+                
+                if progress_callback and i % 10 == 0:
+                    try:
+                        await progress_callback(i + 1, total, str(fpath.name))
+                    except Exception as e:
+                        logger.error(f"Progress callback failed: {e}")
+            if pending:
+                indexed += await asyncio.to_thread(flush, pending)
+            return indexed
         
-        return len(chunks)
+        _, indexed = await asyncio.gather(produce(), consume())
+        return indexed
@@ -4,6 +4,7 @@ Main FastAPI application
 """
 
 import os
+import json
 import logging
 import asyncio
 import uuid
@@ -11,16 +12,18 @@ import time
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Depends, Security, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from datetime import datetime
-import httpx
 
 from indexer import Indexer
-from vectorless import VectorlessSearcher
-from config import settings
+from vectorless import VectorlessSearcher, get_http_client, close_http_client
+from config import get_settings
+
+settings = get_settings()
 
 # Prometheus metrics
 from prometheus_fastapi_instrumentator import Instrumentator
@@ -53,6 +56,15 @@ class JobStatus(str, Enum):
 # In-memory job storage (jobs don't survive restart, which is fine)
 jobs: Dict[str, Dict[str, Any]] = {}
 
+# Set (and replaced) whenever job progress changes, to wake long-poll waiters
+_progress_event = asyncio.Event()
+
+
+def _notify_progress():
+    global _progress_event
+    _progress_event.set()
+    _progress_event = asyncio.Event()
+
 
 # Global instances
 indexer: Indexer = None
@@ -166,6 +178,7 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down Recall API...")
+    await close_http_client()
     if fts_index:
         fts_index.close()
 
@@ -219,8 +232,8 @@ async def update_health_metrics():
     COMPONENT_UP.labels(component="fts").set(1 if fts_index else 0)
     try:
         if fts_index:
-            INDEX_DOCUMENTS.labels(vault="work", index_type="fts").set(fts_index.get_document_count("work"))
-            INDEX_DOCUMENTS.labels(vault="personal", index_type="fts").set(fts_index.get_document_count("personal"))
+            INDEX_DOCUMENTS.labels(vault="work", index_type="fts").set(await asyncio.to_thread(fts_index.get_document_count, "work"))
+            INDEX_DOCUMENTS.labels(vault="personal", index_type="fts").set(await asyncio.to_thread(fts_index.get_document_count, "personal"))
     except:
         pass
 
@@ -367,8 +380,8 @@ async def health_check():
     }
     try:
         if fts_index:
-            stats["work_fts"] = fts_index.get_document_count("work")
-            stats["personal_fts"] = fts_index.get_document_count("personal")
+            stats["work_fts"] = await asyncio.to_thread(fts_index.get_document_count, "work")
+            stats["personal_fts"] = await asyncio.to_thread(fts_index.get_document_count, "personal")
             INDEX_DOCUMENTS.labels(vault="work", index_type="fts").set(stats["work_fts"])
             INDEX_DOCUMENTS.labels(vault="personal", index_type="fts").set(stats["personal_fts"])
     except:
@@ -554,6 +567,7 @@ async def _run_indexing_job(job_id: str, full: bool, vault: str, callback_url: O
             "percent": round((processed / total) * 100, 1) if total > 0 else 0,
             "current_file": current_file,
         }
+        _notify_progress()
     
     try:
         if full:
@@ -573,14 +587,14 @@ async def _run_indexing_job(job_id: str, full: bool, vault: str, callback_url: O
         INDEX_JOB_RUNNING.set(0)
         INDEX_PROGRESS_PERCENT.set(100)
         INDEX_ETA_SECONDS.set(0)
+        _notify_progress()
         
         if callback_url:
             try:
-                async with httpx.AsyncClient() as client:
-                    await client.post(callback_url, json={
-                        "job_id": job_id, "status": "completed",
-                        "stats": {"indexed": indexed, "duration_ms": duration_ms},
-                    }, timeout=30.0)
+                await get_http_client().post(callback_url, json={
+                    "job_id": job_id, "status": "completed",
+                    "stats": {"indexed": indexed, "duration_ms": duration_ms},
+                }, timeout=30.0)
             except Exception as e:
                 logger.error(f"Callback failed: {e}")
     
@@ -595,6 +609,7 @@ async def _run_indexing_job(job_id: str, full: bool, vault: str, callback_url: O
         logger.error(f"Job {job_id} failed: {e}")
         INDEX_JOB_RUNNING.set(0)
         INDEX_ETA_SECONDS.set(0)
+        _notify_progress()
 
 
 @app.post("/index/start", response_model=AsyncIndexStartResponse)
@@ -725,11 +740,63 @@ async def list_jobs(limit: int = 10):
 
 
 @app.get("/index/progress")
-async def get_index_progress():
+async def get_index_progress(wait: float = 0, since: Optional[int] = None):
     """Get current indexing progress (for the most recent running job).
     
     Returns a simple progress summary for easy monitoring.
+    
+    Long-poll: with ?wait=<seconds>&since=<processed>, the response is held
+    until processed moves past `since`, the job stops running, or `wait`
+    (capped at 60s) elapses - whichever comes first.
+    """
+    snapshot = _progress_snapshot()
+    if wait <= 0 or since is None:
+        return snapshot
+    
+    deadline = time.monotonic() + min(wait, 60)
+    while snapshot["status"] == "running" and snapshot["processed"] <= since:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            await asyncio.wait_for(_progress_event.wait(), timeout=remaining)
+        except asyncio.TimeoutError:
+            break
+        snapshot = _progress_snapshot()
+    return snapshot
+
+
+@app.get("/index/progress/stream")
+async def stream_index_progress():
+    """Server-Sent Events feed of /index/progress.
+    
+    Sends one `data:` frame per progress change and closes once the job is no
+    longer running. A `:keepalive` comment goes out after ~21s of silence so
+    proxies don't drop the idle connection.
     """
+    async def events():
+        while True:
+            event = _progress_event
+            snapshot = _progress_snapshot()
+            yield f"data: {json.dumps(snapshot)}\n\n"
+            if snapshot["status"] != "running":
+                return
+            while True:
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=21)
+                    break
+                except asyncio.TimeoutError:
+                    yield ":keepalive\n\n"
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def _progress_snapshot() -> Dict[str, Any]:
+    """Build the /index/progress payload from the in-memory job table."""
     global jobs
     
     # Find the most recent running job
@@ -806,8 +873,8 @@ async def get_stats():
     stats = {"work_fts": 0, "personal_fts": 0}
     try:
         if fts_index:
-            stats["work_fts"] = fts_index.get_document_count("work")
-            stats["personal_fts"] = fts_index.get_document_count("personal")
+            stats["work_fts"] = await asyncio.to_thread(fts_index.get_document_count, "work")
+            stats["personal_fts"] = await asyncio.to_thread(fts_index.get_document_count, "personal")
     except:
         pass
     return stats
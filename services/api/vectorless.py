@@ -13,6 +13,7 @@ Supports two modes:
 """
 
 import os
+import asyncio
 import logging
 import time
 from typing import List, Dict, Optional, Tuple
@@ -41,11 +42,13 @@ COMMON_WORDS = {
     'september', 'october', 'november', 'december',
 }
 
+NON_WORD_RE = re.compile(r'[^\w]')
+
 def detect_names(query: str):
     names = set()
     words = query.split()
     for i, word in enumerate(words):
-        clean = re.sub(r'[^\w]', '', word)
+        clean = NON_WORD_RE.sub('', word)
         if not clean: continue
         if i == 0: continue
         if clean[0].isupper() and not clean.isupper():
@@ -55,6 +58,29 @@ def detect_names(query: str):
 
 logger = logging.getLogger(__name__)
 
+# One pooled client for LLM calls and job callbacks, so requests reuse
+# warm connections instead of a TCP/TLS handshake each
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared AsyncClient, created on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60),
+        )
+    return _client
+
+
+async def close_http_client():
+    """Close the shared client (app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 class VectorlessSearcher:
     """
@@ -127,34 +153,16 @@ class VectorlessSearcher:
             name_query = " ".join(detected_names)
             logger.info(f"Vectorless person query: names={detected_names}, BM25 name query: '{name_query}'")
             
-            # Name-focused search (finds docs mentioning the person)
-            name_results = self.fts_index.search(
-                query=name_query, vault=vault, limit=self.bm25_top_k,
-                person=None, date_from=date_from, date_to=date_to,
+            # Name-focused search boosted 3x plus the full query; scores ADD
+            # when both match (double relevance signal). Merged in SQLite.
+            # FTS calls block, so they run on a thread using a pooled reader
+            results = await asyncio.to_thread(
+                self.fts_index.search_boosted,
+                name_query=name_query, query=search_query, vault=vault,
+                limit=self.bm25_top_k, person=person,
+                date_from=date_from, date_to=date_to, name_boost=3.0,
             )
             
-            # Full query search
-            full_results = self.fts_index.search(
-                query=search_query, vault=vault, limit=self.bm25_top_k,
-                person=person, date_from=date_from, date_to=date_to,
-            )
-            
-            # Merge: name results boosted 3x, scores ADD when both match
-            seen = {}
-            for r in name_results:
-                key = r.get("file_path", "")
-                r["score"] = r.get("score", 0) * 3.0
-                seen[key] = r
-            for r in full_results:
-                key = r.get("file_path", "")
-                if key not in seen:
-                    seen[key] = r
-                else:
-                    # Both searches found it — add scores (double relevance signal)
-                    seen[key]["score"] = seen[key]["score"] + r.get("score", 0)
-            
-            results = sorted(seen.values(), key=lambda x: x.get("score", 0), reverse=True)
-            
             # Boost named 1:1 notes, penalize raw transcripts
             for r in results:
                 title = r.get("title", "").lower()
@@ -164,7 +172,8 @@ class VectorlessSearcher:
                     r["score"] = r.get("score", 0) * 0.8
             results.sort(key=lambda x: x.get("score", 0), reverse=True)
         else:
-            results = self.fts_index.search(
+            results = await asyncio.to_thread(
+                self.fts_index.search,
                 query=search_query, vault=vault, limit=self.bm25_top_k,
                 person=person, date_from=date_from, date_to=date_to,
             )
@@ -389,24 +398,25 @@ Answer concisely but thoroughly. Reference specific meetings, dates, and people
         }
         
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    url,
-                    headers={"Content-Type": "application/json"},
-                    json=payload,
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extract text from Gemini response
-                candidates = data.get("candidates", [])
-                if candidates:
-                    parts = candidates[0].get("content", {}).get("parts", [])
-                    if parts:
-                        return parts[0].get("text", "No response generated.")
-                
-                logger.warning(f"Gemini returned unexpected format: {data}")
-                return "Gemini returned an unexpected response format."
+            client = get_http_client()
+            response = await client.post(
+                url,
+                headers={"Content-Type": "application/json"},
+                json=payload,
+                timeout=120.0,
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            # Extract text from Gemini response
+            candidates = data.get("candidates", [])
+            if candidates:
+                parts = candidates[0].get("content", {}).get("parts", [])
+                if parts:
+                    return parts[0].get("text", "No response generated.")
+            
+            logger.warning(f"Gemini returned unexpected format: {data}")
+            return "Gemini returned an unexpected response format."
         
         except Exception as e:
             logger.error(f"Gemini API error: {e}")
@@ -420,22 +430,23 @@ Answer concisely but thoroughly. Reference specific meetings, dates, and people
     async def _generate_openclaw(self, prompt: str, sources: List[Dict]) -> str:
         """Generate answer using OpenClaw gateway."""
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                response = await client.post(
-                    f"{self.llm_url}/v1/chat/completions",
-                    headers={
-                        "Authorization": f"Bearer {self.llm_token}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.llm_model,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "max_tokens": 2000,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"]
+            client = get_http_client()
+            response = await client.post(
+                f"{self.llm_url}/v1/chat/completions",
+                headers={
+                    "Authorization": f"Bearer {self.llm_token}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.llm_model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "max_tokens": 2000,
+                },
+                timeout=120.0,
+            )
+            response.raise_for_status()
+            data = response.json()
+            return data["choices"][0]["message"]["content"]
         
         except Exception as e:
             logger.error(f"OpenClaw gateway error: {e}")